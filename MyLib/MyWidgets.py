@@ -5,19 +5,73 @@
 
 class列表：
 ----------
+RenderCache（渲染缓存）
+
+PaintProfiler（绘制统计）
+
+FrameClock（动画时钟）
+
+RoundedStyle（圆角样式）
+
 RoundedWidget（圆角窗体）
 
 RoundedButton（圆角按钮）
 
 ShadowFrame（阴影边框）
+
+RoundedItemDelegate（圆角列表项代理）
+
+RoundedButtonDelegate（圆角按钮代理）
+
+RoundedListView（圆角列表）
+
+function列表：
+-------------
+sharedRenderCache（共享渲染缓存）
+
+paintProfiler（绘制统计）
+
+frameClock（动画时钟）
+
+applyStyleTree（批量应用样式）
+
+renderImages（离屏渲染）
+
+drawRoundedShape（绘制圆角形状）
+
+drawShadow（绘制阴影）
+
+rasterizeRoundedShape（圆角形状光栅化）
+
+rasterizeShadow（阴影光栅化）
+
+rasterizeBlurShadow（模糊阴影光栅化）
+
+rasterizeParallel（并行光栅化）
+
+prewarmRenderCache（预热渲染缓存）
 """
 
 
 ###########################
 ###-------加载模块-------###
 ###########################
-from PyQt5 import QtWidgets, QtCore, QtGui
+from PyQt5 import QtWidgets, QtCore, QtGui, sip
+import bisect
+import collections
+import concurrent.futures
+import contextlib
+import functools
+import json
+import os
+import time
 import typing
+import weakref
+
+try:
+    import numpy as _numpy
+except ImportError:             ### 可选依赖：没有NumPy时用Qt缩放近似模糊 ###
+    _numpy = None
 
 
 
@@ -27,14 +81,1267 @@ import typing
 ###-------定义类-------###
 #########################
 
+### -----渲染缓存----- ###
+class RenderCache(object):
+
+    ### 构造函数 ###
+    def __init__(self, byte_limit: int = 32 * 1024 * 1024) -> None:
+        if not isinstance(byte_limit, int):
+            raise TypeError("Parameter passed error! The parameter type must be 'int'.")
+
+        ### private属性 ###
+        self.__byte_limit:      int = max(0, byte_limit)
+        self.__byte_count:      int = 0
+        self.__hits:            int = 0
+        self.__misses:          int = 0
+        self.__evictions:       int = 0
+        self.__entries:         collections.OrderedDict[tuple, QtGui.QPixmap] = collections.OrderedDict()
+
+
+
+    ### private类函数 ###
+    def __cost(self, pixmap: QtGui.QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+
+    def __trim(self) -> None:
+        while self.__byte_count > self.__byte_limit and self.__entries:
+            key, pixmap = self.__entries.popitem(last=False)
+            self.__byte_count -= self.__cost(pixmap)
+            self.__evictions += 1
+
+
+
+    ### 定义类函数 ###
+    def find(self, key: tuple) -> QtGui.QPixmap | None:
+        pixmap = self.__entries.get(key)
+        if pixmap is None:
+            self.__misses += 1
+            return None
+        self.__entries.move_to_end(key)
+        self.__hits += 1
+        return pixmap
+
+
+
+    def contains(self, key: tuple) -> bool:
+        return key in self.__entries
+
+
+
+    def insert(self, key: tuple, pixmap: QtGui.QPixmap) -> None:
+        if not isinstance(pixmap, QtGui.QPixmap):
+            raise TypeError("Parameter passed error! The parameter type must be 'QPixmap'.")
+
+        old = self.__entries.pop(key, None)
+        if old is not None:
+            self.__byte_count -= self.__cost(old)
+
+        cost = self.__cost(pixmap)
+        if cost > self.__byte_limit:
+            return
+        self.__entries[key] = pixmap
+        self.__byte_count += cost
+        self.__trim()
+
+
+
+    def setByteLimit(self, byte_limit: int) -> None:
+        if not isinstance(byte_limit, int):
+            raise TypeError("Parameter passed error! The parameter type must be 'int'.")
+        self.__byte_limit = max(0, byte_limit)
+        self.__trim()
+
+
+
+    def byteLimit(self) -> int:
+        return self.__byte_limit
+
+
+
+    def byteCount(self) -> int:
+        return self.__byte_count
+
+
+
+    def count(self) -> int:
+        return len(self.__entries)
+
+
+
+    def clear(self) -> None:
+        self.__entries.clear()
+        self.__byte_count = 0
+
+
+
+    def hits(self) -> int:
+        return self.__hits
+
+
+
+    def misses(self) -> int:
+        return self.__misses
+
+
+
+    def evictions(self) -> int:
+        return self.__evictions
+
+
+
+    def resetStatistics(self) -> None:
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+
+
+    def statistics(self) -> dict[str, int]:
+        return {
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "evictions": self.__evictions,
+            "count": len(self.__entries),
+            "bytes": self.__byte_count,
+            "byte_limit": self.__byte_limit
+        }
+
+
+
+_shared_render_cache: RenderCache = RenderCache()
+
+
+
+def sharedRenderCache() -> RenderCache:
+    return _shared_render_cache
+
+
+
+
+
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+
+
+
+
+
+### -----绘制统计----- ###
+class PaintProfiler(QtCore.QObject):
+
+    ### 定义信号 ###
+    painted:    QtCore.pyqtSignal = QtCore.pyqtSignal(str, float, int)     # class name, seconds, paint area
+
+
+
+    ### 构造函数 ###
+    def __init__(self) -> None:
+        super().__init__()
+
+        ### public属性 ###
+        self.enabled:               bool = False
+
+        ### private属性 ###
+        self.__instance_stats:      weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.__class_stats:         dict[str, dict] = {}
+
+
+
+    ### private类函数 ###
+    def __newStats(self) -> dict:
+        return {"count": 0, "total": 0.0, "max": 0.0, "area": 0}
+
+
+
+    def __addTo(self, stats: dict, seconds: float, area: int) -> None:
+        stats["count"] += 1
+        stats["total"] += seconds
+        stats["area"] += area
+        if seconds > stats["max"]:
+            stats["max"] = seconds
+
+
+
+    ### 定义类函数 ###
+    def setEnabled(self, judge: bool) -> None:
+        if not isinstance(judge, bool):
+            raise TypeError("Parameter passed error! The parameter type must be 'bool'.")
+        self.enabled = judge
+
+
+
+    def isEnabled(self) -> bool:
+        return self.enabled
+
+
+
+    def record(self, widget: QtWidgets.QWidget, seconds: float, rect: QtCore.QRect) -> None:
+        name = type(widget).__qualname__
+        area = rect.width() * rect.height()
+
+        stats = self.__instance_stats.get(widget)
+        if stats is None:
+            stats = self.__instance_stats[widget] = self.__newStats()
+        self.__addTo(stats, seconds, area)
+
+        stats = self.__class_stats.get(name)
+        if stats is None:
+            stats = self.__class_stats[name] = self.__newStats()
+        self.__addTo(stats, seconds, area)
+
+        self.painted.emit(name, seconds, area)
+
+
+
+    def instanceStatistics(self, widget: QtWidgets.QWidget) -> dict | None:
+        stats = self.__instance_stats.get(widget)
+        return None if stats is None else dict(stats)
+
+
+
+    def classStatistics(self) -> dict[str, dict]:
+        return {name: dict(stats) for name, stats in self.__class_stats.items()}
+
+
+
+    def reset(self) -> None:
+        self.__instance_stats.clear()
+        self.__class_stats.clear()
+
+
+
+    def dumpJson(self, path: str | None = None) -> str:
+        instances = []
+        for widget, stats in list(self.__instance_stats.items()):
+            if sip.isdeleted(widget):
+                ### C++对象已销毁而Python包装仍存活，直接剔除 ###
+                del self.__instance_stats[widget]
+                continue
+            item = dict(stats)
+            item["class"] = type(widget).__qualname__
+            item["object_name"] = widget.objectName()
+            item["id"] = "%x" % id(widget)
+            instances.append(item)
+
+        text = json.dumps({"classes": self.classStatistics(), "instances": instances}, indent=2)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(text)
+        return text
+
+
+
+_paint_profiler: PaintProfiler = PaintProfiler()
+_profiled_widgets: set[int] = set()          # 正在计时的控件，子类重写再调用super()时只记录最外层
+
+
+
+def paintProfiler() -> PaintProfiler:
+    return _paint_profiler
+
+
+
+def _profiledPaint(function: typing.Callable) -> typing.Callable:
+    @functools.wraps(function)
+    def paintEvent(self, a0: QtGui.QPaintEvent) -> None:
+        if not _paint_profiler.enabled or id(self) in _profiled_widgets:
+            return function(self, a0)
+        _profiled_widgets.add(id(self))
+        try:
+            start = time.perf_counter()
+            result = function(self, a0)
+            _paint_profiler.record(self, time.perf_counter() - start, a0.rect())
+        finally:
+            _profiled_widgets.discard(id(self))
+        return result
+    return paintEvent
+
+
+
+
+
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+
+
+
+
+
+### -----动画时钟----- ###
+class FrameClock(QtCore.QObject):
+
+    ### 构造函数 ###
+    def __init__(self, frame_rate: int = 60) -> None:
+        super().__init__()
+
+        ### private属性 ###
+        self.__frame_rate:      int = frame_rate
+        self.__timer:           QtCore.QTimer = QtCore.QTimer(self)
+        self.__elapsed:         QtCore.QElapsedTimer = QtCore.QElapsedTimer()
+        self.__animations:      dict[tuple, list] = {}
+
+        ### 初始化 ###
+        self.__timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self.__timer.setInterval(max(1, 1000 // self.__frame_rate))
+        self.__timer.timeout.connect(self.__tick)
+
+
+
+    ### private类函数 ###
+    def __tick(self) -> None:
+        now = self.__elapsed.elapsed()
+        for key, (owner, begin, duration, step) in list(self.__animations.items()):
+            if sip.isdeleted(owner):
+                self.__animations.pop(key, None)
+                continue
+
+            progress = min(1.0, (now - begin) / duration)
+            if progress >= 1.0:
+                self.__animations.pop(key, None)
+            step(progress)
+
+        if not self.__animations:
+            self.__timer.stop()
+
+
+
+    ### 定义类函数 ###
+    def start(
+        self, 
+        owner: QtCore.QObject, 
+        name: str, 
+        duration: int, 
+        step: typing.Callable[[float], None]
+    ) -> None:
+
+        if not self.__elapsed.isValid():
+            self.__elapsed.start()
+        self.__animations[(id(owner), name)] = [owner, self.__elapsed.elapsed(), max(1, duration), step]
+        if not self.__timer.isActive():
+            self.__timer.start()
+
+
+
+    def stop(self, owner: QtCore.QObject, name: str) -> None:
+        self.__animations.pop((id(owner), name), None)
+        if not self.__animations:
+            self.__timer.stop()
+
+
+
+    def isAnimating(self, owner: QtCore.QObject, name: str) -> bool:
+        return (id(owner), name) in self.__animations
+
+
+
+    def count(self) -> int:
+        return len(self.__animations)
+
+
+
+    def isActive(self) -> bool:
+        return self.__timer.isActive()
+
+
+
+    def setFrameRate(self, frame_rate: int) -> None:
+        if not isinstance(frame_rate, int):
+            raise TypeError("Parameter passed error! The parameter type must be 'int'.")
+        self.__frame_rate = max(1, frame_rate)
+        self.__timer.setInterval(max(1, 1000 // self.__frame_rate))
+
+
+
+    def frameRate(self) -> int:
+        return self.__frame_rate
+
+
+
+_frame_clock: FrameClock = None
+
+
+
+def frameClock() -> FrameClock:
+    global _frame_clock
+    if _frame_clock is None:
+        _frame_clock = FrameClock()
+    return _frame_clock
+
+
+
+def _copyGradient(gradient: QtGui.QGradient) -> QtGui.QGradient:
+    match type(gradient):
+        case QtGui.QLinearGradient:
+            return QtGui.QLinearGradient(gradient)
+        case QtGui.QRadialGradient:
+            return QtGui.QRadialGradient(gradient)
+        case QtGui.QConicalGradient:
+            return QtGui.QConicalGradient(gradient)
+        case _:
+            return QtGui.QGradient(gradient)
+
+
+
+def _gradientKey(gradient: QtGui.QGradient | None) -> tuple | None:
+    if gradient is None:
+        return None
+
+    match type(gradient):
+        case QtGui.QLinearGradient:
+            geometry = (
+                gradient.start().x(), gradient.start().y(),
+                gradient.finalStop().x(), gradient.finalStop().y()
+            )
+        case QtGui.QRadialGradient:
+            geometry = (
+                gradient.center().x(), gradient.center().y(), gradient.centerRadius(),
+                gradient.focalPoint().x(), gradient.focalPoint().y(), gradient.focalRadius()
+            )
+        case QtGui.QConicalGradient:
+            geometry = (gradient.center().x(), gradient.center().y(), gradient.angle())
+        case _:
+            geometry = ()
+
+    return (
+        type(gradient).__name__,
+        int(gradient.spread()),
+        int(gradient.coordinateMode()),
+        geometry,
+        tuple((pos, color.rgba()) for pos, color in gradient.stops())
+    )
+
+
+
+def _mixColor(a: QtGui.QColor, b: QtGui.QColor, t: float) -> QtGui.QColor:
+    return QtGui.QColor(
+        round(a.red() + (b.red() - a.red()) * t),
+        round(a.green() + (b.green() - a.green()) * t),
+        round(a.blue() + (b.blue() - a.blue()) * t),
+        round(a.alpha() + (b.alpha() - a.alpha()) * t)
+    )
+
+
+
+def _stopColorAt(stops: list, pos: float) -> QtGui.QColor:
+    if pos <= stops[0][0]:
+        return stops[0][1]
+    for i in range(1, len(stops)):
+        if pos <= stops[i][0]:
+            span = stops[i][0] - stops[i - 1][0]
+            t = 0 if span == 0 else (pos - stops[i - 1][0]) / span
+            return _mixColor(stops[i - 1][1], stops[i][1], t)
+    return stops[-1][1]
+
+
+
+def _mixBrush(
+    start_color: QtGui.QColor, 
+    start_gradient: QtGui.QGradient | None, 
+    end_color: QtGui.QColor, 
+    end_gradient: QtGui.QGradient | None, 
+    t: float
+) -> QtGui.QColor | QtGui.QGradient:
+
+    if start_gradient is None and end_gradient is None:
+        return _mixColor(start_color, end_color, t)
+
+    start_stops = [(0.0, start_color)] if start_gradient is None or not start_gradient.stops() else start_gradient.stops()
+    end_stops = [(0.0, end_color)] if end_gradient is None or not end_gradient.stops() else end_gradient.stops()
+    result = _copyGradient(end_gradient if end_gradient is not None else start_gradient)
+    positions = sorted({pos for pos, color in start_stops} | {pos for pos, color in end_stops} | {0.0, 1.0})
+    result.setStops([
+        (pos, _mixColor(_stopColorAt(start_stops, pos), _stopColorAt(end_stops, pos), t)) 
+        for pos in positions
+    ])
+    return result
+
+
+
+
+
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+
+
+
+
+
+### -----圆角样式----- ###
+class RoundedStyle(object):
+
+    __slots__ = ("__values", "__key")
+
+
+
+    ### 构造函数 ###
+    def __init__(
+        self, 
+        background: QtGui.QColor | None = None, 
+        bottom: QtGui.QColor | None = None, 
+        entered: QtGui.QColor | None = None, 
+        pressed: QtGui.QColor | None = None, 
+        text: QtGui.QColor | None = None, 
+        background_gradient: QtGui.QGradient | None = None, 
+        entered_gradient: QtGui.QGradient | None = None, 
+        pressed_gradient: QtGui.QGradient | None = None, 
+        radius: int | float | None = None, 
+        bottom_width: int | float | None = None, 
+        bottom_visible: bool | None = None, 
+        bottom_offset: tuple | None = None, 
+        background_offset: tuple | None = None, 
+        remove_gradients: bool = False
+    ) -> None:
+
+        for color in (background, bottom, entered, pressed, text):
+            if color is not None and not isinstance(color, QtGui.QColor):
+                raise TypeError("Parameter passed error! The color type must be 'QColor'.")
+        for gradient in (background_gradient, entered_gradient, pressed_gradient):
+            if gradient is not None and not isinstance(gradient, QtGui.QGradient):
+                raise TypeError("Parameter passed error! The gradient type must be 'QGradient'.")
+        for number in (radius, bottom_width):
+            if number is not None and not isinstance(number, (int, float)):
+                raise TypeError("Parameter passed error! The parameter type must be 'int' or 'float'.")
+        for offset in (bottom_offset, background_offset):
+            if offset is not None and not (
+                isinstance(offset, (tuple, list)) and 
+                len(offset) == 4 and 
+                all(isinstance(value, (int, float)) for value in offset)
+            ):
+                raise TypeError("Parameter passed error! The offset must be 4 'int' or 'float' values.")
+        if (bottom_visible is not None and not isinstance(bottom_visible, bool)) or not isinstance(remove_gradients, bool):
+            raise TypeError("Parameter passed error! The parameter type must be 'bool'.")
+
+        values = {
+            "background": None if background is None else QtGui.QColor(background),
+            "bottom": None if bottom is None else QtGui.QColor(bottom),
+            "entered": None if entered is None else QtGui.QColor(entered),
+            "pressed": None if pressed is None else QtGui.QColor(pressed),
+            "text": None if text is None else QtGui.QColor(text),
+            "background_gradient": None if background_gradient is None else _copyGradient(background_gradient),
+            "entered_gradient": None if entered_gradient is None else _copyGradient(entered_gradient),
+            "pressed_gradient": None if pressed_gradient is None else _copyGradient(pressed_gradient),
+            "radius": radius,
+            "bottom_width": bottom_width,
+            "bottom_visible": bottom_visible,
+            "bottom_offset": None if bottom_offset is None else tuple(bottom_offset),
+            "background_offset": None if background_offset is None else tuple(background_offset),
+            "remove_gradients": remove_gradients
+        }
+        object.__setattr__(self, "_RoundedStyle__values", values)
+        object.__setattr__(self, "_RoundedStyle__key", None)
+
+
+
+    ### 重写类函数 ###
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        raise AttributeError("'RoundedStyle' object is immutable")
+
+
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RoundedStyle):
+            return NotImplemented
+        return self.key() == other.key()
+
+
+
+    def __hash__(self) -> int:
+        return hash(self.key())
+
+
+
+    def __repr__(self) -> str:
+        return "RoundedStyle(%s)" % ", ".join(
+            "%s=%r" % (name, value) for name, value in zip(self.__values, self.key()) if value is not None and value is not False
+        )
+
+
+
+    ### private类函数 ###
+    def __color(self, name: str) -> QtGui.QColor | None:
+        color = self.__values.get(name)
+        return None if color is None else QtGui.QColor(color)
+
+
+
+    def __gradient(self, name: str) -> QtGui.QGradient | None:
+        gradient = self.__values.get(name)
+        return None if gradient is None else _copyGradient(gradient)
+
+
+
+    ### 定义类函数 ###
+    def key(self) -> tuple:
+        if self.__key is None:
+            key = tuple(
+                value.rgba() if isinstance(value, QtGui.QColor) else 
+                _gradientKey(value) if isinstance(value, QtGui.QGradient) else 
+                value 
+                for value in self.__values.values()
+            )
+            object.__setattr__(self, "_RoundedStyle__key", key)
+        return self.__key
+
+
+
+    def replace(self, **kwargs) -> "RoundedStyle":
+        values = dict(self.__values)
+        for name in kwargs:
+            if name not in values:
+                raise TypeError("Parameter passed error! Unknown style field '%s'." % name)
+        values.update(kwargs)
+        return RoundedStyle(**values)
+
+
+
+    def backgroundColor(self) -> QtGui.QColor | None:
+        return self.__color("background")
+
+
+
+    def bottomColor(self) -> QtGui.QColor | None:
+        return self.__color("bottom")
+
+
+
+    def enteredColor(self) -> QtGui.QColor | None:
+        return self.__color("entered")
+
+
+
+    def pressedColor(self) -> QtGui.QColor | None:
+        return self.__color("pressed")
+
+
+
+    def textColor(self) -> QtGui.QColor | None:
+        return self.__color("text")
+
+
+
+    def backgroundGradient(self) -> QtGui.QGradient | None:
+        return self.__gradient("background_gradient")
+
+
+
+    def enteredGradient(self) -> QtGui.QGradient | None:
+        return self.__gradient("entered_gradient")
+
+
+
+    def pressedGradient(self) -> QtGui.QGradient | None:
+        return self.__gradient("pressed_gradient")
+
+
+
+    def radius(self) -> int | float | None:
+        return self.__values.get("radius")
+
+
+
+    def bottomWidth(self) -> int | float | None:
+        return self.__values.get("bottom_width")
+
+
+
+    def bottomVisible(self) -> bool | None:
+        return self.__values.get("bottom_visible")
+
+
+
+    def bottomOffset(self) -> tuple | None:
+        return self.__values.get("bottom_offset")
+
+
+
+    def backgroundOffset(self) -> tuple | None:
+        return self.__values.get("background_offset")
+
+
+
+    def removeGradients(self) -> bool:
+        return self.__values.get("remove_gradients")
+
+
+
+_WIDGET_DARK_STYLE: RoundedStyle = RoundedStyle(
+    bottom_visible=True,
+    bottom=QtGui.QColor(200, 200, 200),
+    background=QtGui.QColor(20, 20, 45)
+)
+_WIDGET_LIGHT_STYLE: RoundedStyle = RoundedStyle(
+    bottom_visible=True,
+    bottom=QtGui.QColor(50, 50, 50),
+    background=QtGui.QColor(240, 240, 240)
+)
+_BUTTON_DARK_STYLE: RoundedStyle = RoundedStyle(
+    bottom_visible=True,
+    text=QtGui.QColor(200, 200, 200),
+    bottom=QtGui.QColor(200, 200, 200),
+    entered=QtGui.QColor(65, 65, 85),
+    pressed=QtGui.QColor(50, 50, 70),
+    background=QtGui.QColor(40, 40, 60)
+)
+_BUTTON_LIGHT_STYLE: RoundedStyle = RoundedStyle(
+    bottom_visible=True,
+    text=QtGui.QColor(50, 50, 50),
+    bottom=QtGui.QColor(50, 50, 50),
+    entered=QtGui.QColor(240, 240, 240),
+    pressed=QtGui.QColor(220, 220, 220),
+    background=QtGui.QColor(250, 250, 250)
+)
+_ITEM_LIGHT_STYLE: RoundedStyle = RoundedStyle(         ### 与默认RoundedButton外观一致 ###
+    radius=10,
+    bottom_width=1.5,
+    bottom_visible=True,
+    text=QtGui.QColor(50, 50, 50),
+    bottom=QtGui.QColor(50, 50, 50),
+    entered=QtGui.QColor(240, 240, 240),
+    pressed=QtGui.QColor(220, 220, 220),
+    background=QtGui.QColor(250, 250, 250)
+)
+
+
+
+def applyStyleTree(parent: QtWidgets.QWidget, style: RoundedStyle) -> None:
+    if not isinstance(parent, QtWidgets.QWidget):
+        raise TypeError("Parameter passed error! The parameter type must be 'QWidget'.")
+    elif not isinstance(style, RoundedStyle):
+        raise TypeError("Parameter passed error! The parameter type must be 'RoundedStyle'.")
+
+    widgets = parent.findChildren(RoundedWidget)
+    if isinstance(parent, RoundedWidget):
+        widgets.insert(0, parent)
+
+    for widget in widgets:
+        widget.applyStyle(style)        ### update() requests are merged into one paint pass ###
+
+
+
+
+
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+
+
+
+
+
+### -----光栅化函数（纯函数，可在工作线程中对QImage调用）----- ###
+def drawRoundedShape(
+    painter: QtGui.QPainter,
+    width: int | float,
+    height: int | float,
+    radius: int | float,
+    bottom_width: int | float,
+    bottom_visible: bool,
+    bottom_offset: typing.Sequence[int | float],
+    background_offset: typing.Sequence[int | float],
+    bottom_color: QtGui.QColor,
+    background_brush: QtGui.QColor | QtGui.QGradient
+) -> None:
+    painter.setRenderHint(QtGui.QPainter.Antialiasing, True)      ### 抗锯齿 ###
+    painter.setPen(QtGui.QColor(QtCore.Qt.transparent))
+
+    rect = QtCore.QRectF(
+        0 + bottom_offset[0],
+        0 + bottom_offset[1],
+        width + bottom_offset[2], 
+        height + bottom_offset[3]
+    )
+
+    if bottom_visible:
+        painter.setBrush(bottom_color)
+        painter.drawRoundedRect(rect, radius, radius)
+    
+    rect = QtCore.QRectF(
+        bottom_width + background_offset[0],
+        bottom_width + background_offset[1],
+        width - 2 * bottom_width + background_offset[2], 
+        height - 2 * bottom_width + background_offset[3]
+    )
+    
+    painter.setBrush(background_brush)
+    painter.drawRoundedRect(rect, radius - bottom_width , radius - bottom_width)
+
+
+
+def drawShadow(
+    painter: QtGui.QPainter,
+    width: int | float,
+    height: int | float,
+    radius: int | float,
+    shadow_width: int | float,
+    rect_gradient: QtGui.QLinearGradient,
+    pie_gradient: QtGui.QRadialGradient
+) -> None:
+    painter.setPen(QtGui.QColor(QtCore.Qt.transparent))
+    painter.setRenderHint(QtGui.QPainter.Antialiasing)
+
+    radiu = radius + shadow_width
+    pie_rect_width = 2 * radiu
+    left, above = radiu, radiu
+    right, below = width - radiu, height - radiu
+    pie_gradient.setCenterRadius(radiu)
+
+    for x, y, angle in (
+        (left, above, 90),
+        (right, above, 0),
+        (left, below, 180),
+        (right, below, 270)
+    ):
+        center = QtCore.QPointF(x, y)
+        pie_gradient.setCenter(center)
+        pie_gradient.setFocalPoint(center)
+        painter.setBrush(pie_gradient)
+        painter.drawPie(
+            QtCore.QRectF(x - radiu, y - radiu, pie_rect_width, pie_rect_width),
+            angle * 16,
+            90 * 16
+        )
+
+    rect_gradient.setStart(shadow_width, 0)
+    rect_gradient.setFinalStop(0, 0)
+    painter.setBrush(rect_gradient)
+    painter.drawRect(QtCore.QRectF(0, above, shadow_width, below - above))
+
+    rect_gradient.setStart(0, shadow_width)
+    rect_gradient.setFinalStop(0, 0)
+    painter.setBrush(rect_gradient)
+    painter.drawRect(QtCore.QRectF(left, 0, right - left, shadow_width))
+
+    rect_gradient.setStart(width - shadow_width, 0)
+    rect_gradient.setFinalStop(width, 0)
+    painter.setBrush(rect_gradient)
+    painter.drawRect(QtCore.QRectF(width - shadow_width, above, shadow_width, below - above))
+
+    rect_gradient.setStart(0, height - shadow_width)
+    rect_gradient.setFinalStop(0, height)
+    painter.setBrush(rect_gradient)
+    painter.drawRect(QtCore.QRectF(left, height - shadow_width, right - left, shadow_width))
+
+
+
+def _shadowGradients(
+    radius: int | float, 
+    shadow_width: int | float, 
+    stops: list
+) -> tuple[QtGui.QLinearGradient, QtGui.QRadialGradient]:
+    a = radius / (radius + shadow_width)
+    b = shadow_width / (radius + shadow_width)
+    rect_gradient = QtGui.QLinearGradient()
+    pie_gradient = QtGui.QRadialGradient()
+    rect_gradient.setStops(stops)
+    pie_gradient.setStops([(a + b * pos, color) for pos, color in stops])
+    return rect_gradient, pie_gradient
+
+
+
+def _shadowTextureKey(radius: int | float, shadow_width: int | float, ratio: float, stops: list) -> tuple:
+    return (
+        "ShadowFrame",
+        radius,
+        shadow_width,
+        ratio,
+        tuple((pos, color.rgba()) for pos, color in stops)
+    )
+
+
+
+def _newImage(width: int | float, height: int | float, ratio: float, rounding: float) -> QtGui.QImage:
+    image = QtGui.QImage(
+        max(1, int(width * ratio + rounding)),
+        max(1, int(height * ratio + rounding)),
+        QtGui.QImage.Format_ARGB32_Premultiplied
+    )
+    image.setDevicePixelRatio(ratio)
+    image.fill(QtCore.Qt.transparent)
+    return image
+
+
+
+def _stateBrush(style: RoundedStyle, state: str) -> QtGui.QColor | QtGui.QGradient | None:
+    ### pressed -> entered -> standard 依次回退，与RoundedButton的状态一致 ###
+    getters = {
+        "pressed": (style.pressedGradient, style.pressedColor),
+        "entered": (style.enteredGradient, style.enteredColor),
+        "standard": (style.backgroundGradient, style.backgroundColor)
+    }
+    order = ("pressed", "entered", "standard")
+    if state not in getters:
+        raise TypeError("Parameter passed error! The state must be 'standard', 'entered' or 'pressed'.")
+
+    for name in order[order.index(state):]:
+        for getter in getters[name]:
+            brush = getter()
+            if brush is not None:
+                return brush
+    return None
+
+
+
+def rasterizeRoundedShape(
+    style: RoundedStyle, 
+    size: QtCore.QSize | tuple[int, int], 
+    ratio: float = 1.0,
+    state: str = "standard"
+) -> QtGui.QImage:
+    if not isinstance(style, RoundedStyle):
+        raise TypeError("Parameter passed error! The parameter type must be 'RoundedStyle'.")
+    if isinstance(size, QtCore.QSize):
+        size = (size.width(), size.height())
+
+    ### 样式中未设置的字段使用RoundedWidget的默认值 ###
+    radius = style.radius()
+    bottom_width = style.bottomWidth()
+    bottom_visible = style.bottomVisible()
+    bottom_offset = style.bottomOffset()
+    background_offset = style.backgroundOffset()
+    bottom_color = style.bottomColor()
+    background_brush = _stateBrush(style, state)
+
+    image = _newImage(size[0], size[1], ratio, 0.5)
+    painter = QtGui.QPainter(image)
+    drawRoundedShape(
+        painter,
+        size[0],
+        size[1],
+        10 if radius is None else radius,
+        0 if bottom_width is None else bottom_width,
+        True if bottom_visible is None else bottom_visible,
+        (0, 0, 0, 0) if bottom_offset is None else bottom_offset,
+        (0, 0, 0, 0) if background_offset is None else background_offset,
+        QtGui.QColor(50, 50, 50) if bottom_color is None else bottom_color,
+        QtGui.QColor(240, 240, 240) if background_brush is None else background_brush
+    )
+    painter.end()
+    return image
+
+
+
+def rasterizeShadow(
+    radius: int | float, 
+    shadow_width: int | float, 
+    stops: list, 
+    size: QtCore.QSize | tuple[int, int] | None = None, 
+    ratio: float = 1.0
+) -> QtGui.QImage:
+    rect_gradient, pie_gradient = _shadowGradients(radius, shadow_width, stops)
+
+    ### size为None时绘制九宫格纹理（边长 2 * (radius + shadow_width) + 1） ###
+    if size is None:
+        side = 2 * (radius + shadow_width) + 1
+        image = _newImage(side, side, ratio, 0.999)
+        size = (side, side)
+    else:
+        if isinstance(size, QtCore.QSize):
+            size = (size.width(), size.height())
+        image = _newImage(size[0], size[1], ratio, 0.5)
+
+    painter = QtGui.QPainter(image)
+    drawShadow(painter, size[0], size[1], radius, shadow_width, rect_gradient, pie_gradient)
+    painter.end()
+    return image
+
+
+
+def _shadowTexture(radius: int | float, shadow_width: int, ratio: float, stops: list) -> QtGui.QPixmap:
+    key = _shadowTextureKey(radius, shadow_width, ratio, stops)
+    texture = _shared_render_cache.find(key)
+    if texture is None:
+        texture = QtGui.QPixmap.fromImage(rasterizeShadow(radius, shadow_width, stops, None, ratio))
+        _shared_render_cache.insert(key, texture)
+    return texture
+
+
+
+def _drawNinePatch(
+    painter: QtGui.QPainter, 
+    texture: QtGui.QPixmap, 
+    width: int | float, 
+    height: int | float, 
+    radius: int | float, 
+    shadow_width: int | float, 
+    ratio: float
+) -> None:
+    radiu = radius + shadow_width
+    size = 2 * radiu + 1
+
+    for tx, ty, tw, th, sx, sy, sw, sh in (
+        (0, 0, radiu, radiu, 0, 0, radiu, radiu),
+        (width - radiu, 0, radiu, radiu, radiu + 1, 0, radiu, radiu),
+        (0, height - radiu, radiu, radiu, 0, radiu + 1, radiu, radiu),
+        (width - radiu, height - radiu, radiu, radiu, radiu + 1, radiu + 1, radiu, radiu),
+        (0, radiu, shadow_width, height - 2 * radiu, 0, radiu, shadow_width, 1),
+        (radiu, 0, width - 2 * radiu, shadow_width, radiu, 0, 1, shadow_width),
+        (width - shadow_width, radiu, shadow_width, height - 2 * radiu, size - shadow_width, radiu, shadow_width, 1),
+        (radiu, height - shadow_width, width - 2 * radiu, shadow_width, radiu, size - shadow_width, 1, shadow_width)
+    ):
+        painter.drawPixmap(
+            QtCore.QRectF(tx, ty, tw, th),
+            texture,
+            QtCore.QRectF(sx * ratio, sy * ratio, sw * ratio, sh * ratio)
+        )
+
+
+
+### 模糊阴影：单次缓存未命中的代价 ###
+### 1. 在缩小后的遮罩上绘制一次圆角矩形（缩小倍数使低分辨率下 sigma 约为 4 像素） ###
+### 2. 可分离盒式模糊，水平与垂直各3次，NumPy下每次为一次cumsum，O(低分辨率像素数) ###
+### 3. 着色后平滑放大到目标尺寸，O(目标像素数) ###
+### 800x600、blur=30 时约4毫秒（NumPy）或约2.5毫秒（Qt缩放近似，衰减较窄），缓存占用约2.3MB ###
+### 命中后只剩一次drawPixmap；相同尺寸、圆角与参数的控件共用同一条缓存 ###
+def _boxBlur(array: typing.Any, radius: int, axis: int) -> typing.Any:
+    pad = [(0, 0), (0, 0)]
+    pad[axis] = (radius + 1, radius)
+    total = _numpy.cumsum(_numpy.pad(array, pad), axis=axis, dtype=_numpy.float32)
+    width = 2 * radius + 1
+    if axis == 0:
+        return (total[width:] - total[:-width]) / width
+    return (total[:, width:] - total[:, :-width]) / width
+
+
+
+def _blurMask(mask: QtGui.QImage, sigma: float) -> QtGui.QImage:
+    if sigma <= 0:
+        return mask
+
+    if _numpy is not None:
+        ### 三次盒式模糊近似高斯模糊 ###
+        radius = max(1, round(((4 * sigma * sigma + 1) ** 0.5 - 1) / 2))
+        width, height = mask.width(), mask.height()
+        line = mask.bytesPerLine()
+        buffer = mask.bits()
+        buffer.setsize(line * height)
+        array = _numpy.frombuffer(buffer, dtype=_numpy.uint8).reshape(height, line)[:, :width].astype(_numpy.float32)
+        for i in range(3):
+            array = _boxBlur(array, radius, 0)
+            array = _boxBlur(array, radius, 1)
+
+        data = _numpy.ascontiguousarray(_numpy.clip(array + 0.5, 0, 255).astype(_numpy.uint8))
+        blurred = QtGui.QImage(data.data, width, height, width, QtGui.QImage.Format_Alpha8)
+        return blurred.copy()       ### 脱离NumPy缓冲区 ###
+
+    ### 没有NumPy时：平滑缩小再平滑放大，近似宽度为 4 * sigma 的帐篷滤波 ###
+    factor = 2 * sigma
+    small = mask.scaled(
+        max(1, round(mask.width() / factor)), 
+        max(1, round(mask.height() / factor)), 
+        QtCore.Qt.IgnoreAspectRatio, 
+        QtCore.Qt.SmoothTransformation
+    )
+    return small.scaled(mask.size(), QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation)
+
+
+
+def rasterizeBlurShadow(
+    size: QtCore.QSize | tuple[int, int], 
+    radius: int | float, 
+    blur: int, 
+    spread: int, 
+    color: QtGui.QColor, 
+    ratio: float = 1.0
+) -> QtGui.QImage:
+    if isinstance(size, QtCore.QSize):
+        size = (size.width(), size.height())
+
+    ### 结果覆盖形状向外扩展 blur + spread 的区域 ###
+    extent = blur + spread
+    full_width = size[0] + 2 * extent
+    full_height = size[1] + 2 * extent
+    scale = min(1.0, 8 / (blur * ratio)) if blur > 0 else 1.0
+
+    mask = QtGui.QImage(
+        max(1, int(full_width * ratio * scale + 0.5)), 
+        max(1, int(full_height * ratio * scale + 0.5)), 
+        QtGui.QImage.Format_Alpha8
+    )
+    mask.fill(0)
+    painter = QtGui.QPainter(mask)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+    painter.setPen(QtCore.Qt.NoPen)
+    painter.setBrush(QtGui.QColor(0, 0, 0, 255))
+    painter.scale(mask.width() / full_width, mask.height() / full_height)
+    painter.drawRoundedRect(
+        QtCore.QRectF(blur, blur, size[0] + 2 * spread, size[1] + 2 * spread), 
+        max(0, radius + spread), 
+        max(0, radius + spread)
+    )
+    painter.end()
+
+    mask = _blurMask(mask, blur * ratio * scale / 2)
+
+    shadow = QtGui.QImage(mask.size(), QtGui.QImage.Format_ARGB32_Premultiplied)
+    shadow.fill(color)
+    painter = QtGui.QPainter(shadow)
+    painter.setCompositionMode(QtGui.QPainter.CompositionMode_DestinationIn)
+    painter.drawImage(0, 0, mask)
+    painter.end()
+
+    image = shadow.scaled(
+        max(1, int(full_width * ratio + 0.5)), 
+        max(1, int(full_height * ratio + 0.5)), 
+        QtCore.Qt.IgnoreAspectRatio, 
+        QtCore.Qt.SmoothTransformation
+    )
+    image.setDevicePixelRatio(ratio)
+    return image
+
+
+
+def _blurShadowKey(
+    size: tuple[int, int], 
+    radius: int | float, 
+    blur: int, 
+    spread: int, 
+    color: QtGui.QColor, 
+    ratio: float
+) -> tuple:
+    return ("BlurShadow", size[0], size[1], radius, blur, spread, color.rgba(), ratio)
+
+
+
+def _blurShadowPixmap(
+    size: tuple[int, int], 
+    radius: int | float, 
+    blur: int, 
+    spread: int, 
+    color: QtGui.QColor, 
+    ratio: float
+) -> QtGui.QPixmap:
+    key = _blurShadowKey(size, radius, blur, spread, color, ratio)
+    pixmap = _shared_render_cache.find(key)
+    if pixmap is None:
+        pixmap = QtGui.QPixmap.fromImage(rasterizeBlurShadow(size, radius, blur, spread, color, ratio))
+        _shared_render_cache.insert(key, pixmap)
+    return pixmap
+
+
+
+
+
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+
+
+
+
+
+### -----文字排版缓存（按钮之间共享）----- ###
+class _TextLayoutCache(object):
+
+    ### 构造函数 ###
+    def __init__(self, limit: int = 1024) -> None:
+
+        ### private属性 ###
+        self.__limit:   int = limit
+        self.__widths:  collections.OrderedDict[tuple, float] = collections.OrderedDict()
+        self.__texts:   collections.OrderedDict[tuple, QtGui.QStaticText] = collections.OrderedDict()
+
+
+
+    ### private类函数 ###
+    def __remember(self, entries: collections.OrderedDict, key: tuple, value: typing.Any) -> None:
+        entries[key] = value
+        if len(entries) > self.__limit:
+            entries.popitem(last=False)
+
+
+
+    ### 定义类函数 ###
+    def textWidth(self, text: str, font: QtGui.QFont, font_key: str) -> float:
+        key = (text, font_key)
+        width = self.__widths.get(key)
+        if width is None:
+            width = QtGui.QFontMetricsF(font).horizontalAdvance(text)
+            self.__remember(self.__widths, key, width)
+        return width
+
+
+
+    def staticText(
+        self, 
+        text: str, 
+        font: QtGui.QFont, 
+        width: int | float, 
+        mode: QtCore.Qt.TextElideMode
+    ) -> QtGui.QStaticText:
+        font_key = font.key()
+        if mode == QtCore.Qt.ElideNone or self.textWidth(text, font, font_key) <= width:
+            key = (text, font_key, None)        ### 文字完整显示时与宽度无关，缩放不会重新排版 ###
+        else:
+            key = (text, font_key, int(width), int(mode))
+
+        static_text = self.__texts.get(key)
+        if static_text is not None:
+            self.__texts.move_to_end(key)
+            return static_text
+
+        if key[2] is not None:
+            text = QtGui.QFontMetricsF(font).elidedText(text, mode, width)
+        static_text = QtGui.QStaticText(text)
+        static_text.setTextFormat(QtCore.Qt.PlainText)
+        static_text.prepare(QtGui.QTransform(), font)
+        self.__remember(self.__texts, key, static_text)
+        return static_text
+
+
+
+    def clear(self) -> None:
+        self.__widths.clear()
+        self.__texts.clear()
+
+
+
+_text_layout_cache: _TextLayoutCache = _TextLayoutCache()
+
+
+
+
+
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+
+
+
+
+
+### -----圆角区域（按形状缓存，供setMask使用）----- ###
+@functools.lru_cache(maxsize=256)
+def _roundedRegion(left: float, top: float, right: float, bottom: float, radius: float) -> QtGui.QRegion:
+    path = QtGui.QPainterPath()
+    path.addRoundedRect(QtCore.QRectF(left, top, right - left, bottom - top), radius, radius)
+    return QtGui.QRegion(path.toFillPolygon().toPolygon())
+
+
+
+
+
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+
+
+
+
+
 ### -----圆角窗体----- ###
 class RoundedWidget(QtWidgets.QWidget):
 
     ### 定义信号 ###
-    clicked:    QtCore.pyqtSignal = QtCore.pyqtSignal()
-    entered:    QtCore.pyqtSignal = QtCore.pyqtSignal()
-    pressed:    QtCore.pyqtSignal = QtCore.pyqtSignal()
-    left:       QtCore.pyqtSignal = QtCore.pyqtSignal()
+    clicked:        QtCore.pyqtSignal = QtCore.pyqtSignal()
+    entered:        QtCore.pyqtSignal = QtCore.pyqtSignal()
+    pressed:        QtCore.pyqtSignal = QtCore.pyqtSignal()
+    left:           QtCore.pyqtSignal = QtCore.pyqtSignal()
+    radiusChanged:  QtCore.pyqtSignal = QtCore.pyqtSignal(float)
 
 
 
@@ -45,9 +1352,9 @@ class RoundedWidget(QtWidgets.QWidget):
     def __init__(self, parent: QtWidgets.QWidget | None = ...) -> None: pass
 
     @typing.overload
-    def setBackgroundColor(self, r: int, g: int, b: int, alpha: int = ...) -> None: pass
+    def setBackgroundColor(self, r: int, g: int, b: int, alpha: int = ..., *, animated: bool = ...) -> None: pass
     @typing.overload
-    def setBackgroundColor(self, color: QtGui.QColor) -> None: pass
+    def setBackgroundColor(self, color: QtGui.QColor, *, animated: bool = ...) -> None: pass
 
     @typing.overload
     def setBottomColor(self, r: int, g: int, b: int, alpha: int = ...) -> None: pass
@@ -72,11 +1379,30 @@ class RoundedWidget(QtWidgets.QWidget):
         self.__draw_bottom:             bool = True
         self.__bottom_offset:           list = [0, 0, 0, 0]
         self.__background_offset:       list = [0, 0, 0, 0]
+        self.__cache_enabled:           bool = False
+        self.__cache_shared:            bool = False
+        self.__cache_dirty:             bool = True
+        self.__cache_key:               tuple = None
+        self.__cache_pixmap:            QtGui.QPixmap = None
+        self.__batch_depth:             int = 0
+        self.__batch_dirty:             bool = False
+        self.__shadow_margin:           int = 0
+        self.__shadow_texture:          QtGui.QPixmap = None
+        self.__hit_test:                bool = False
+        self.__hit_shape:               tuple = None
+        self.__hovered:                 bool = False
+        self.__mask_enabled:            bool = False
+        self.__mask_shape:              tuple = None
+        self.__animating:               bool = False
 
         self.__color_dict: dict[str, QtGui.QColor] = {
             "background": QtGui.QColor(240, 240, 240, 255),
             "bottom": QtGui.QColor(50, 50, 50, 255)
         }
+        self.__shadow_stops: dict[float, QtGui.QColor] = {
+            0: QtGui.QColor(0, 0, 0, 80),
+            1: QtGui.QColor(0, 0, 0, 0)
+        }
 
     
     
@@ -109,39 +1435,222 @@ class RoundedWidget(QtWidgets.QWidget):
 
 
 
-    ### 重写类函数 ###
-    def paintEvent(self, a0: QtGui.QPaintEvent) -> None:
-        painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)      ### 抗锯齿 ###
-        painter.setPen(QtGui.QColor(QtCore.Qt.transparent))
-
-        rect = QtCore.QRectF(
-            0 + self.__bottom_offset[0],
-            0 + self.__bottom_offset[1],
-            self.rect().width() + self.__bottom_offset[2], 
-            self.rect().height() + self.__bottom_offset[3]
+    def __flash(self) -> None:
+        self.__cache_dirty = True
+        self.__shadow_texture = None
+        self.__hit_shape = None
+        if self.__mask_enabled:
+            self.__updateMask()
+        if self.__batch_depth > 0:
+            self.__batch_dirty = True
+            return
+        self.update()
+
+
+
+    def __hitShape(self) -> tuple:
+        ### 外轮廓：(left, top, right, bottom, radius)，形状改变或尺寸改变时重新计算 ###
+        if self.__hit_shape is None:
+            margin = self.__shadow_margin
+            width = QtWidgets.QWidget.width(self) - 2 * margin
+            height = QtWidgets.QWidget.height(self) - 2 * margin
+            if self.__draw_bottom:
+                offset = self.__bottom_offset
+                left = margin + offset[0]
+                top = margin + offset[1]
+                right = left + width + offset[2]
+                bottom = top + height + offset[3]
+                radius = self.__radius
+            else:
+                offset = self.__background_offset
+                left = margin + self.__bottom_width + offset[0]
+                top = margin + self.__bottom_width + offset[1]
+                right = left + width - 2 * self.__bottom_width + offset[2]
+                bottom = top + height - 2 * self.__bottom_width + offset[3]
+                radius = self.__radius - self.__bottom_width
+            radius = max(0, min(radius, (right - left) / 2, (bottom - top) / 2))
+            self.__hit_shape = (left, top, right, bottom, radius)
+        return self.__hit_shape
+
+
+
+    def __contains(self, x: float, y: float) -> bool:
+        left, top, right, bottom, radius = self.__hitShape()
+        if not (left <= x < right and top <= y < bottom):
+            return False
+        dx = max(left + radius - x, x - (right - radius), 0)
+        dy = max(top + radius - y, y - (bottom - radius), 0)
+        return dx * dx + dy * dy <= radius * radius
+
+
+
+    def __inside(self, x: float, y: float) -> bool:
+        ### 未开启命中测试时只排除阴影边距，边距内的鼠标事件交给父控件 ###
+        if self.__hit_test:
+            return self.__contains(x, y)
+        margin = self.__shadow_margin
+        return margin < x < QtWidgets.QWidget.width(self) - margin and margin < y < QtWidgets.QWidget.height(self) - margin
+
+
+
+    def __setAnimating(self, judge: bool) -> None:
+        ### 动画帧的画刷不会复用：不深拷贝，也不写入共享缓存 ###
+        if self.__animating and not judge:
+            self.__cache_key = None         ### 最后一帧可能与终态同键，重新从共享缓存取图 ###
+        self.__animating = judge
+
+
+
+    def __updateMask(self) -> None:
+        shape = self.__hitShape()
+        if shape != self.__mask_shape:
+            self.__mask_shape = shape
+            self.setMask(_roundedRegion(*shape))
+
+
+
+    def __cacheKey(self, ratio: float) -> tuple:
+        return (
+            "RoundedWidget",
+            QtWidgets.QWidget.width(self) - 2 * self.__shadow_margin,
+            QtWidgets.QWidget.height(self) - 2 * self.__shadow_margin,
+            ratio,
+            self.__radius,
+            self.__bottom_width,
+            self.__draw_bottom,
+            tuple(self.__bottom_offset),
+            tuple(self.__background_offset),
+            self.__color_dict.get("bottom").rgba(),
+            self.__color_dict.get("background").rgba(),
+            _gradientKey(self.__background_gradient)
         )
 
-        if self.__draw_bottom:
-            painter.setBrush(self.__color_dict.get("bottom"))
-            painter.drawRoundedRect(rect, self.__radius, self.__radius)
-        
-        rect = QtCore.QRectF(
-            self.__bottom_width + self.__background_offset[0],
-            self.__bottom_width + self.__background_offset[1],
-            self.rect().width() - 2 * self.__bottom_width + self.__background_offset[2], 
-            self.rect().height() - 2 * self.__bottom_width + self.__background_offset[3]
+
+
+    def __renderPixmap(self, ratio: float) -> QtGui.QPixmap:
+        pixmap = QtGui.QPixmap(
+            max(1, int((QtWidgets.QWidget.width(self) - 2 * self.__shadow_margin) * ratio + 0.5)),
+            max(1, int((QtWidgets.QWidget.height(self) - 2 * self.__shadow_margin) * ratio + 0.5))
         )
-        
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.transparent)
+
+        painter = QtGui.QPainter(pixmap)
+        self.__drawShape(painter)
+        painter.end()
+        return pixmap
+
+
+
+    def __cachedPixmap(self, key: tuple, ratio: float) -> QtGui.QPixmap:
+        if not self.__cache_shared or self.__animating:       ### 动画中间帧不会复用，不写入共享缓存 ###
+            return self.__renderPixmap(ratio)
+
+        pixmap = _shared_render_cache.find(key)
+        if pixmap is None:
+            pixmap = self.__renderPixmap(ratio)
+            _shared_render_cache.insert(key, pixmap)
+        return pixmap
+
+
+
+    def __drawShape(self, painter: QtGui.QPainter) -> None:
         if self.__background_gradient is not None:
-            painter.setBrush(self.__background_gradient)
+            background_brush = self.__background_gradient
+        else:
+            background_brush = self.__color_dict.get("background")
+
+        drawRoundedShape(
+            painter,
+            QtWidgets.QWidget.width(self) - 2 * self.__shadow_margin,
+            QtWidgets.QWidget.height(self) - 2 * self.__shadow_margin,
+            self.__radius,
+            self.__bottom_width,
+            self.__draw_bottom,
+            self.__bottom_offset,
+            self.__background_offset,
+            self.__color_dict.get("bottom"),
+            background_brush
+        )
+
+
+
+    def __paintShadow(self, painter: QtGui.QPainter) -> None:
+        ratio = self.devicePixelRatioF()
+        if self.__shadow_texture is None or self.__shadow_texture.devicePixelRatioF() != ratio:
+            self.__shadow_texture = _shadowTexture(self.__radius, self.__shadow_margin, ratio, self.shadowColorStops())
+        _drawNinePatch(
+            painter, 
+            self.__shadow_texture, 
+            QtWidgets.QWidget.width(self), 
+            QtWidgets.QWidget.height(self), 
+            self.__radius, 
+            self.__shadow_margin, 
+            ratio
+        )
+        painter.translate(self.__shadow_margin, self.__shadow_margin)       ### 形状向内缩进阴影边距 ###
+
+
+
+    ### 重写类函数 ###
+    @_profiledPaint
+    def paintEvent(self, a0: QtGui.QPaintEvent) -> None:
+        painter = QtGui.QPainter(self)
+        if self.__shadow_margin > 0:
+            self.__paintShadow(painter)
+
+        if self.__cache_enabled:
+            ratio = self.devicePixelRatioF()
+            if self.__cache_dirty or self.__cache_pixmap.devicePixelRatioF() != ratio:
+                key = self.__cacheKey(ratio)
+                if key != self.__cache_key:
+                    self.__cache_key = key
+                    self.__cache_pixmap = self.__cachedPixmap(key, ratio)
+                self.__cache_dirty = False
+            painter.drawPixmap(0, 0, self.__cache_pixmap)
         else:
-            painter.setBrush(self.__color_dict.get("background"))
-        painter.drawRoundedRect(rect, self.__radius - self.__bottom_width , self.__radius - self.__bottom_width)
+            self.__drawShape(painter)
         return super().paintEvent(a0)
     
 
 
+    def resizeEvent(self, a0: QtGui.QResizeEvent) -> None:
+        self.__cache_dirty = True
+        self.__hit_shape = None
+        if self.__mask_enabled:
+            self.__updateMask()
+        return super().resizeEvent(a0)
+
+
+
+    def event(self, a0: QtCore.QEvent) -> bool:
+        if self.__hit_test or self.__shadow_margin > 0:
+            match a0.type():
+                case QtCore.QEvent.Enter:
+                    pos = a0.localPos() if isinstance(a0, QtGui.QEnterEvent) else self.mapFromGlobal(QtGui.QCursor.pos())
+                    if not self.__inside(pos.x(), pos.y()):
+                        return True         ### 进入的是透明圆角，推迟到鼠标移入形状再触发 ###
+                    self.__hovered = True
+                case QtCore.QEvent.Leave:
+                    if not self.__hovered:
+                        return True
+                    self.__hovered = False
+                case QtCore.QEvent.MouseMove:
+                    inside = self.__inside(a0.x(), a0.y())
+                    if inside != self.__hovered:
+                        self.__hovered = inside
+                        if inside:
+                            self.enterEvent(QtGui.QEnterEvent(a0.localPos(), a0.windowPos(), a0.screenPos()))
+                        else:
+                            self.leaveEvent(QtCore.QEvent(QtCore.QEvent.Leave))
+                case QtCore.QEvent.MouseButtonPress | QtCore.QEvent.MouseButtonDblClick:
+                    if not self.__inside(a0.x(), a0.y()):
+                        a0.ignore()         ### 点击圆角或阴影时交给父控件处理 ###
+                        return False
+        return super().event(a0)
+    
+
+
     def mousePressEvent(self, a0: QtGui.QMouseEvent) -> None:
         if a0.button() == QtCore.Qt.MouseButton.LeftButton:
             self.pressed.emit()
@@ -162,11 +1671,8 @@ class RoundedWidget(QtWidgets.QWidget):
 
 
     def mouseReleaseEvent(self, a0: QtGui.QMouseEvent) -> None:
-        if (
-            0 < a0.x() < self.width() and 
-            0 < a0.y() < self.height() and 
-            a0.button() == QtCore.Qt.MouseButton.LeftButton
-        ):
+        inside = self.__inside(a0.x(), a0.y())
+        if inside and a0.button() == QtCore.Qt.MouseButton.LeftButton:
             self.clicked.emit()
         return super().mouseReleaseEvent(a0)
 
@@ -176,11 +1682,14 @@ class RoundedWidget(QtWidgets.QWidget):
     def setRadius(self, r: int | float) -> None:
         if not isinstance(r, (int, float)):
             raise TypeError("Parameter passed error! The parameter type must be 'int' or 'float'.")
+        old = self.__radius
         if r < 0:
             self.__radius = 0
         else:
             self.__radius = r
-        self.update()
+        self.__flash()
+        if self.__radius != old:
+            self.radiusChanged.emit(self.__radius)
          
     
 
@@ -193,7 +1702,7 @@ class RoundedWidget(QtWidgets.QWidget):
         if not isinstance(judge, bool):
             raise TypeError("Parameter passed error! The parameter type must be 'bool'.")
         self.__draw_bottom = judge
-        self.update()
+        self.__flash()
 
 
 
@@ -202,10 +1711,15 @@ class RoundedWidget(QtWidgets.QWidget):
         a0: int | QtGui.QColor, 
         a1: int | None = None, 
         a2: int | None = None, 
-        a3: int | None = None
+        a3: int | None = None,
+        *,
+        animated: bool = False
     ) -> None:
+        if not isinstance(animated, bool):
+            raise TypeError("Parameter passed error! The parameter type must be 'bool'.")
         self.__setColorDict(a0, a1, a2, a3, "background")
-        self.update()
+        self.__setAnimating(animated)
+        self.__flash()
 
 
 
@@ -216,7 +1730,7 @@ class RoundedWidget(QtWidgets.QWidget):
             self.__bottom_width = 0
         else:
             self.__bottom_width = width
-        self.update()
+        self.__flash()
             
     
     
@@ -228,7 +1742,7 @@ class RoundedWidget(QtWidgets.QWidget):
         a3: int | None = None
     ) -> None:
         self.__setColorDict(a0, a1, a2, a3, "bottom")
-        self.update()
+        self.__flash()
 
 
 
@@ -238,22 +1752,61 @@ class RoundedWidget(QtWidgets.QWidget):
 
 
     def setDarkStyle(self) -> None:
-        self.setBottomVisible(True)
-        self.setBottomColor(200, 200, 200)
-        self.setBackgroundColor(20, 20, 45)
+        self.applyStyle(_WIDGET_DARK_STYLE)
         
 
 
     def setLightStyle(self) -> None:
-        self.setBottomVisible(True)
-        self.setBottomColor(50, 50, 50)
-        self.setBackgroundColor(240, 240, 240)
+        self.applyStyle(_WIDGET_LIGHT_STYLE)
+
+
+
+    def applyStyle(self, style: RoundedStyle) -> None:
+        if not isinstance(style, RoundedStyle):
+            raise TypeError("Parameter passed error! The parameter type must be 'RoundedStyle'.")
+
+        if style.removeGradients():
+            self.__background_gradient = None
+        for key, color in (("background", style.backgroundColor()), ("bottom", style.bottomColor())):
+            if color is not None:
+                self.__color_dict[key] = color
+
+        gradient = style.backgroundGradient()
+        if gradient is not None:
+            self.__background_gradient = gradient
+        old_radius = self.__radius
+        radius = style.radius()
+        if radius is not None:
+            self.__radius = max(0, radius)
+        bottom_width = style.bottomWidth()
+        if bottom_width is not None:
+            self.__bottom_width = max(0, bottom_width)
+        bottom_visible = style.bottomVisible()
+        if bottom_visible is not None:
+            self.__draw_bottom = bottom_visible
+        offset = style.bottomOffset()
+        if offset is not None:
+            self.__bottom_offset = list(offset)
+        offset = style.backgroundOffset()
+        if offset is not None:
+            self.__background_offset = list(offset)
+        self.__flash()
+        if self.__radius != old_radius:
+            self.radiusChanged.emit(self.__radius)
         
 
 
-    def setBackgroundGradient(self, gradient: QtGui.QGradient) -> None:
+    def setBackgroundGradient(self, gradient: QtGui.QGradient, *, animated: bool = False) -> None:
         if not isinstance(gradient, QtGui.QGradient):
             raise TypeError("Parameter passed error! The parameter type must be 'QGradient'.")
+        elif not isinstance(animated, bool):
+            raise TypeError("Parameter passed error! The parameter type must be 'bool'.")
+
+        self.__setAnimating(animated)
+        if animated:
+            self.__background_gradient = gradient       ### 动画帧的渐变每帧新建，直接持有 ###
+            self.__flash()
+            return
         self.__background_gradient = None
         match type(gradient):
             case QtGui.QLinearGradient:
@@ -264,13 +1817,20 @@ class RoundedWidget(QtWidgets.QWidget):
                 self.__background_gradient = QtGui.QConicalGradient(gradient)
             case QtGui.QGradient:
                 self.__background_gradient = QtGui.QGradient(gradient)
-        self.update()
+        self.__flash()
     
 
 
     def removeGradients(self) -> None:
         self.__background_gradient = None
-        self.update()
+        self.__flash()
+    
+
+
+    def backgroundGradient(self) -> QtGui.QGradient | None:
+        if self.__background_gradient is None:
+            return None
+        return _copyGradient(self.__background_gradient)
     
 
 
@@ -279,6 +1839,11 @@ class RoundedWidget(QtWidgets.QWidget):
     
 
 
+    def bottomVisible(self) -> bool:
+        return self.__draw_bottom
+    
+
+
     def bottomColor(self) -> QtGui.QColor:
         return QtGui.QColor(self.__color_dict.get("bottom"))
     
@@ -303,7 +1868,7 @@ class RoundedWidget(QtWidgets.QWidget):
         self.__bottom_offset[1] = y
         self.__bottom_offset[2] = w
         self.__bottom_offset[3] = h
-        self.update()
+        self.__flash()
     
 
 
@@ -326,7 +1891,7 @@ class RoundedWidget(QtWidgets.QWidget):
         self.__background_offset[1] = y
         self.__background_offset[2] = w
         self.__background_offset[3] = h
-        self.update()
+        self.__flash()
 
 
 
@@ -340,6 +1905,146 @@ class RoundedWidget(QtWidgets.QWidget):
 
 
 
+    def setCacheEnabled(self, judge: bool) -> None:
+        if not isinstance(judge, bool):
+            raise TypeError("Parameter passed error! The parameter type must be 'bool'.")
+        self.__cache_enabled = judge
+        self.__cache_dirty = True
+        if not judge:
+            self.__cache_key = None
+            self.__cache_pixmap = None
+        self.update()
+
+
+
+    def cacheEnabled(self) -> bool:
+        return self.__cache_enabled
+
+
+
+    def setCacheShared(self, judge: bool) -> None:
+        if not isinstance(judge, bool):
+            raise TypeError("Parameter passed error! The parameter type must be 'bool'.")
+        self.__cache_shared = judge
+        self.__cache_key = None
+        if judge:
+            self.setCacheEnabled(True)
+        else:
+            self.__cache_dirty = True
+            self.update()
+
+
+
+    def cacheShared(self) -> bool:
+        return self.__cache_shared
+
+
+
+    def cacheKey(self, ratio: float | None = None) -> tuple:
+        return self.__cacheKey(self.devicePixelRatioF() if ratio is None else ratio)
+
+
+
+    def hitTest(self, pos: QtCore.QPoint | QtCore.QPointF) -> bool:
+        return self.__contains(pos.x(), pos.y())
+
+
+
+    def setHitTestEnabled(self, judge: bool) -> None:
+        if not isinstance(judge, bool):
+            raise TypeError("Parameter passed error! The parameter type must be 'bool'.")
+        self.__hit_test = judge
+        self.__hovered = self.underMouse()
+        self.setMouseTracking(judge or self.__shadow_margin > 0)        ### 需要鼠标移动事件来合成进入/离开 ###
+
+
+
+    def hitTestEnabled(self) -> bool:
+        return self.__hit_test
+
+
+
+    def setMaskEnabled(self, judge: bool) -> None:
+        if not isinstance(judge, bool):
+            raise TypeError("Parameter passed error! The parameter type must be 'bool'.")
+        self.__mask_enabled = judge
+        self.__mask_shape = None
+        if judge:
+            self.__updateMask()
+        else:
+            self.clearMask()
+
+
+
+    def maskEnabled(self) -> bool:
+        return self.__mask_enabled
+
+
+
+    def setShadowMargin(self, margin: int) -> None:
+        if not isinstance(margin, int):
+            raise TypeError("Parameter passed error! The parameter type must be 'int'.")
+        margin = max(0, margin)
+        delta = margin - self.__shadow_margin
+        contents = self.contentsMargins()           ### 保留使用者自己设置的内容边距 ###
+        self.setContentsMargins(
+            contents.left() + delta, contents.top() + delta, 
+            contents.right() + delta, contents.bottom() + delta
+        )
+        self.__shadow_margin = margin
+        self.__hovered = self.underMouse()
+        self.setMouseTracking(self.__hit_test or margin > 0)
+        self.__flash()
+
+
+
+    def shadowMargin(self) -> int:
+        return self.__shadow_margin
+
+
+
+    def setShadowColorAt(self, pos: int | float, color: QtGui.QColor) -> None:
+        if not (isinstance(pos, (int, float)) and isinstance(color, QtGui.QColor)):
+            raise TypeError("Parameter passed error!")
+        self.__shadow_stops[min(1, max(0, pos))] = QtGui.QColor(color)
+        if self.__shadow_margin > 0:
+            self.__flash()
+
+
+
+    def shadowColorStops(self) -> list[tuple[float, QtGui.QColor]]:
+        return [(pos, QtGui.QColor(self.__shadow_stops[pos])) for pos in sorted(self.__shadow_stops)]
+
+
+
+    def roundedStyle(self) -> RoundedStyle:
+        return RoundedStyle(
+            background=self.__color_dict.get("background"),
+            bottom=self.__color_dict.get("bottom"),
+            background_gradient=self.__background_gradient,
+            radius=self.__radius,
+            bottom_width=self.__bottom_width,
+            bottom_visible=self.__draw_bottom,
+            bottom_offset=tuple(self.__bottom_offset),
+            background_offset=tuple(self.__background_offset),
+            remove_gradients=True
+        )
+
+
+
+    @contextlib.contextmanager
+    def batchUpdate(self) -> typing.Iterator["RoundedWidget"]:
+        self.__batch_depth += 1
+        try:
+            yield self
+        finally:
+            self.__batch_depth -= 1
+            if self.__batch_depth == 0 and self.__batch_dirty:
+                self.__batch_dirty = False
+                self.update()
+
+
+
 
 
 ### ============================================================================================================= ###
@@ -355,13 +2060,13 @@ class RoundedButton(RoundedWidget):
 
     ### 函数重载 ###
     @typing.overload
-    def __init__(self) -> None: pass
+    def __init__(self, *, direct_text: bool = ...) -> None: pass
     @typing.overload
-    def __init__(self, parent: QtWidgets.QWidget | None = ...) -> None: pass
+    def __init__(self, parent: QtWidgets.QWidget | None = ..., *, direct_text: bool = ...) -> None: pass
     @typing.overload
-    def __init__(self, parent: QtWidgets.QWidget | None = ..., text: str = ...) -> None: pass
+    def __init__(self, parent: QtWidgets.QWidget | None = ..., text: str = ..., *, direct_text: bool = ...) -> None: pass
     @typing.overload
-    def __init__(self, text: str = ...) -> None: pass
+    def __init__(self, text: str = ..., *, direct_text: bool = ...) -> None: pass
 
     @typing.overload
     def setBackgroundColor(self, r: int, g: int, b: int, alpha: int = ...) -> None: pass
@@ -389,21 +2094,36 @@ class RoundedButton(RoundedWidget):
     def __init__(
         self, 
         a0: QtWidgets.QWidget | str | None = None, 
-        a1: str | None = None
+        a1: str | None = None,
+        *,
+        direct_text: bool = False
     ) -> None:
         
         if (a0 is not None and a1 is not None) and not isinstance(a0, QtWidgets.QWidget):
             raise TypeError("Parameter passed error!")
+        elif not isinstance(direct_text, bool):
+            raise TypeError("Parameter passed error! The parameter type must be 'bool'.")
         elif isinstance(a0, QtWidgets.QWidget):
             super().__init__(a0)
         else:
             super().__init__()
 
         ### private属性 ###
-        self.__text_lable:      QtWidgets.QLabel = QtWidgets.QLabel(self)
-        self.__h_layout:        QtWidgets.QHBoxLayout = QtWidgets.QHBoxLayout(self)
-        self.__label_palette:   QtGui.QPalette = QtGui.QPalette()
+        self.__direct_text:     bool = direct_text
+        self.__text_lable:      QtWidgets.QLabel = None
+        self.__h_layout:        QtWidgets.QHBoxLayout = None
+        self.__label_palette:   QtGui.QPalette = None
         self.__text_font:       QtGui.QFont = QtGui.QFont()
+        self.__text:            str = ""
+        self.__static_key:      tuple = None
+        self.__static_text:     QtGui.QStaticText = None
+        self.__elide_mode:      QtCore.Qt.TextElideMode = QtCore.Qt.ElideRight if direct_text else QtCore.Qt.ElideNone
+
+        ### 直接绘制模式下不创建子控件、布局与调色板 ###
+        if not direct_text:
+            self.__text_lable = QtWidgets.QLabel(self)
+            self.__h_layout = QtWidgets.QHBoxLayout(self)
+            self.__label_palette = QtGui.QPalette()
 
         self.__color_dict: dict[str, QtGui.QColor] = {
             "standard": QtGui.QColor(250, 250, 250, 255),
@@ -416,21 +2136,26 @@ class RoundedButton(RoundedWidget):
             "entered": None,
             "pressed": None
         }
+        self.__animation_duration:  int = 0
+        self.__animation_from:      tuple = None
+        self.__animation_to:        str = None
 
         ### 初始化 ###
         if isinstance(a1, str):
-            self.__text_lable.setText(a1)
+            self.__text = a1
         elif isinstance(a0, str):
-            self.__text_lable.setText(a0)
+            self.__text = a0
         self.__text_font.setFamily("微软雅黑")
         self.__text_font.setPointSize(11)
-        self.__text_lable.setAlignment(QtCore.Qt.AlignCenter)   ### 字体居中 ###
-        self.__label_palette.setColor(QtGui.QPalette.WindowText, self.__color_dict.get("text"))
-        self.__text_lable.setPalette(self.__label_palette)
-        self.__h_layout.addWidget(self.__text_lable)
+        if not direct_text:
+            self.__text_lable.setText(self.__text)
+            self.__text_lable.setAlignment(QtCore.Qt.AlignCenter)   ### 字体居中 ###
+            self.__label_palette.setColor(QtGui.QPalette.WindowText, self.__color_dict.get("text"))
+            self.__text_lable.setPalette(self.__label_palette)
+            self.__h_layout.addWidget(self.__text_lable)
+            self.__text_lable.setFont(self.__text_font)
         self.setBottomColor(50, 50, 50)
         self.setBottomWidth(1.5)
-        super().setFont(self.__text_font)
         super().setBackgroundColor(self.__color_dict.get("standard"))
 
 
@@ -477,6 +2202,95 @@ class RoundedButton(RoundedWidget):
                 self.__gradient_dict[key] = QtGui.QConicalGradient(gradient)
             case QtGui.QGradient:
                 self.__gradient_dict[key] = QtGui.QGradient(gradient)
+
+
+
+    def __updateTextColor(self) -> None:
+        if self.__direct_text:
+            self.update()
+        else:
+            self.__label_palette.setColor(QtGui.QPalette.WindowText, self.__color_dict.get("text"))
+            self.__text_lable.setPalette(self.__label_palette)
+
+
+
+    def __textChanged(self) -> None:
+        if self.__direct_text:
+            self.__static_key = None
+            self.updateGeometry()
+            self.update()
+        else:
+            self.__text_lable.setFont(self.__text_font)      ### 只设置标签，不向整个子控件树传播 ###
+            self.__refreshLabel()
+
+
+
+    def __refreshLabel(self) -> None:
+        if self.__elide_mode == QtCore.Qt.ElideNone:
+            text = self.__text
+        else:
+            text = _text_layout_cache.staticText(
+                self.__text, 
+                self.__text_font, 
+                self.__text_lable.contentsRect().width(), 
+                self.__elide_mode
+            ).text()
+        if text != self.__text_lable.text():
+            self.__text_lable.setText(text)
+
+
+
+    def __staticText(self) -> QtGui.QStaticText:
+        ### 排版结果来自共享缓存，键为 (文字, 字体, 可用宽度)，只改颜色不会重新排版 ###
+        margin = self.style().pixelMetric(QtWidgets.QStyle.PM_LayoutLeftMargin)
+        width = self.width() - 2 * (margin + self.shadowMargin())
+        key = (self.__text, width, self.__elide_mode)
+        if key != self.__static_key:
+            self.__static_text = _text_layout_cache.staticText(self.__text, self.__text_font, width, self.__elide_mode)
+            self.__static_key = key
+        return self.__static_text
+
+
+
+    def __applyState(self, key: str) -> None:
+        if self.__gradient_dict.get(key) is not None:
+            super().setBackgroundGradient(self.__gradient_dict.get(key))
+        else:
+            super().removeGradients()
+            super().setBackgroundColor(self.__color_dict.get(key))
+
+
+
+    def __transitionTo(self, key: str) -> None:
+        if self.__animation_duration <= 0:
+            frameClock().stop(self, "background")
+            self.__applyState(key)
+            return
+
+        self.__animation_from = (super().backgroundColor(), super().backgroundGradient())
+        self.__animation_to = key
+        frameClock().start(self, "background", self.__animation_duration, self.__animationStep)
+
+
+
+    def __animationStep(self, progress: float) -> None:
+        if progress >= 1.0:
+            self.__applyState(self.__animation_to)
+            return
+
+        t = 1 - (1 - progress) ** 3         ### OutCubic ###
+        brush = _mixBrush(
+            self.__animation_from[0],
+            self.__animation_from[1],
+            self.__color_dict.get(self.__animation_to),
+            self.__gradient_dict.get(self.__animation_to),
+            t
+        )
+        if isinstance(brush, QtGui.QGradient):
+            super().setBackgroundGradient(brush, animated=True)
+        else:
+            super().removeGradients()
+            super().setBackgroundColor(brush, animated=True)
     
 
 
@@ -489,74 +2303,116 @@ class RoundedButton(RoundedWidget):
         a3: int | None = None
     ) -> None:
         self.__setColorDict(a0, a1, a2, a3, "standard")
+        frameClock().stop(self, "background")
         super().setBackgroundColor(self.__color_dict.get("standard"))
 
 
 
+    @_profiledPaint
+    def paintEvent(self, a0: QtGui.QPaintEvent) -> None:
+        super().paintEvent(a0)          ### 嵌套调用不重复计时，文字绘制计入同一次记录 ###
+        if self.__direct_text and self.__text:
+            static_text = self.__staticText()
+            size = static_text.size()
+            painter = QtGui.QPainter(self)
+            painter.setFont(self.__text_font)
+            painter.setPen(self.__color_dict.get("text"))
+            painter.drawStaticText(
+                QtCore.QPointF((self.width() - size.width()) / 2, (self.height() - size.height()) / 2), 
+                static_text
+            )
+            painter.end()
+
+
+
+    def resizeEvent(self, a0: QtGui.QResizeEvent) -> None:
+        if not self.__direct_text and self.__elide_mode != QtCore.Qt.ElideNone:
+            self.__refreshLabel()           ### 布局已先于resizeEvent调整标签尺寸 ###
+        return super().resizeEvent(a0)
+
+
+
+    def sizeHint(self) -> QtCore.QSize:
+        if not self.__direct_text:
+            return super().sizeHint()
+        margin = self.style().pixelMetric(QtWidgets.QStyle.PM_LayoutLeftMargin) + self.shadowMargin()
+        metrics = QtGui.QFontMetrics(self.__text_font)
+        return QtCore.QSize(
+            metrics.horizontalAdvance(self.__text) + 2 * margin, 
+            metrics.height() + 2 * margin
+        )
+
+
+
     def mousePressEvent(self, a0: QtGui.QMouseEvent) -> None:
         if a0.button() == QtCore.Qt.MouseButton.LeftButton:
-            if self.__gradient_dict.get("pressed") is not None:
-                super().setBackgroundGradient(self.__gradient_dict.get("pressed"))
-            else:
-                super().removeGradients()
-                super().setBackgroundColor(self.__color_dict.get("pressed"))
+            self.__transitionTo("pressed")
         return super().mousePressEvent(a0)
 
 
 
     def enterEvent(self, a0: QtCore.QEvent) -> None:
-        if self.__gradient_dict.get("entered") is not None:
-            super().setBackgroundGradient(self.__gradient_dict.get("entered"))
-        else:
-            super().removeGradients()
-            super().setBackgroundColor(self.__color_dict.get("entered"))
+        self.__transitionTo("entered")
         self.setCursor(QtCore.Qt.CursorShape.PointingHandCursor)
         return super().enterEvent(a0)
     
 
 
     def leaveEvent(self, a0: QtCore.QEvent) -> None:
-        if self.__gradient_dict.get("standard") is not None:
-            super().setBackgroundGradient(self.__gradient_dict.get("standard"))
-        else:
-            super().removeGradients()
-            super().setBackgroundColor(self.__color_dict.get("standard"))
+        self.__transitionTo("standard")
+        if self.hitTestEnabled():
+            self.unsetCursor()          ### 圆角处恢复父控件的光标 ###
         return super().leaveEvent(a0)
     
 
 
     def mouseReleaseEvent(self, a0: QtGui.QMouseEvent) -> None:
-        if self.__gradient_dict.get("entered") is not None:
-            super().setBackgroundGradient(self.__gradient_dict.get("entered"))
-        else:
-            super().removeGradients()
-            super().setBackgroundColor(self.__color_dict.get("entered"))
+        self.__transitionTo("entered")
         return super().mouseReleaseEvent(a0)
     
 
 
     def setDarkStyle(self) -> None:
-        self.setBottomVisible(True)
-        self.setTextColor(200, 200, 200)
-        self.setBottomColor(200, 200, 200)
-        self.setEnteredColor(65, 65, 85)
-        self.setPressedColor(50, 50, 70)
-        self.setBackgroundColor(40, 40, 60)
+        self.applyStyle(_BUTTON_DARK_STYLE)
         
 
 
     def setLightStyle(self) -> None:
-        self.setBottomVisible(True)
-        self.setTextColor(50, 50, 50)
-        self.setBottomColor(50, 50, 50)
-        self.setEnteredColor(240, 240, 240)
-        self.setPressedColor(220, 220, 220)
-        self.setBackgroundColor(250, 250, 250)
+        self.applyStyle(_BUTTON_LIGHT_STYLE)
+
+
+
+    def applyStyle(self, style: RoundedStyle) -> None:
+        if not isinstance(style, RoundedStyle):
+            raise TypeError("Parameter passed error! The parameter type must be 'RoundedStyle'.")
+
+        if style.removeGradients():
+            for key in self.__gradient_dict:
+                self.__gradient_dict[key] = None
+        for key, color, gradient in (
+            ("standard", style.backgroundColor(), style.backgroundGradient()),
+            ("entered", style.enteredColor(), style.enteredGradient()),
+            ("pressed", style.pressedColor(), style.pressedGradient())
+        ):
+            if color is not None:
+                self.__color_dict[key] = color
+            if gradient is not None:
+                self.__gradient_dict[key] = gradient
+
+        color = style.textColor()
+        if color is not None:
+            self.__color_dict["text"] = color
+            self.__updateTextColor()
+
+        frameClock().stop(self, "background")
+        super().applyStyle(style)
+        self.__applyState("entered" if self.underMouse() else "standard")
     
 
 
     def setBackgroundGradient(self, gradient: QtGui.QGradient) -> None:
         self.__setGradientDict(gradient, "standard")
+        frameClock().stop(self, "background")
         super().setBackgroundGradient(self.__gradient_dict.get("standard"))
     
 
@@ -564,7 +2420,15 @@ class RoundedButton(RoundedWidget):
     def removeGradients(self) -> None:
         for key in self.__gradient_dict:
             self.__gradient_dict[key] = None
+        frameClock().stop(self, "background")
         super().removeGradients()
+
+
+
+    def backgroundGradient(self) -> QtGui.QGradient | None:
+        if self.__gradient_dict.get("standard") is None:
+            return None
+        return _copyGradient(self.__gradient_dict.get("standard"))
     
 
 
@@ -576,8 +2440,10 @@ class RoundedButton(RoundedWidget):
     def setFont(self, a0: QtGui.QFont) -> None:
         if not isinstance(a0, QtGui.QFont):
             raise TypeError("Parameter passed error! The parameter type must be 'QFont'.")
+        if a0 == self.__text_font:
+            return
         self.__text_font = QtGui.QFont(a0)
-        return super().setFont(self.__text_font)
+        self.__textChanged()
     
     
 
@@ -585,15 +2451,21 @@ class RoundedButton(RoundedWidget):
     def setTextSize(self, size: int | float) -> None:
         if not isinstance(size, (int, float)):
             raise TypeError("Parameter passed error! The parameter type must be 'int' or 'float'.")
+        if self.__text_font.pointSizeF() == float(size):
+            return
         self.__text_font.setPointSizeF(float(size))
-        super().setFont(self.__text_font)
+        self.__textChanged()
 
 
 
     def setText(self, text: str) -> None:
         if not isinstance(text, str):
             raise TypeError("Parameter passed error! The parameter type must be 'str'.")
-        self.__text_lable.setText(text)
+        self.__text = text
+        if self.__direct_text:
+            self.__textChanged()
+        else:
+            self.__refreshLabel()
             
     
 
@@ -627,8 +2499,7 @@ class RoundedButton(RoundedWidget):
         a3: int | None = None
     ) -> None:
         self.__setColorDict(a0, a1, a2, a3, "text")
-        self.__label_palette.setColor(QtGui.QPalette.WindowText, self.__color_dict.get("text"))
-        self.__text_lable.setPalette(self.__label_palette)
+        self.__updateTextColor()
     
 
 
@@ -658,7 +2529,7 @@ class RoundedButton(RoundedWidget):
 
 
     def text(self) -> str:
-        return self.__text_lable.text()
+        return self.__text
     
 
 
@@ -672,20 +2543,92 @@ class RoundedButton(RoundedWidget):
     
 
 
-    def setTextBold(self) -> None:
-        self.__text_font.setBold(True)
-        super().setFont(self.__text_font)
-    
+    def setTextBold(self) -> None:
+        if self.__text_font.bold():
+            return
+        self.__text_font.setBold(True)
+        self.__textChanged()
+    
+
+
+    def removeTextBold(self) -> None:
+        if not self.__text_font.bold():
+            return
+        self.__text_font.setBold(False)
+        self.__textChanged()
+
+
+
+    def setElideMode(self, mode: QtCore.Qt.TextElideMode) -> None:
+        if not isinstance(mode, QtCore.Qt.TextElideMode):
+            raise TypeError("Parameter passed error! The parameter type must be 'Qt.TextElideMode'.")
+        self.__elide_mode = mode
+        if self.__direct_text:
+            self.__textChanged()
+        else:
+            ### 省略时标签不再以完整文字宽度限制按钮的最小尺寸 ###
+            self.__text_lable.setSizePolicy(
+                QtWidgets.QSizePolicy.Preferred if mode == QtCore.Qt.ElideNone else QtWidgets.QSizePolicy.Ignored,
+                QtWidgets.QSizePolicy.Preferred
+            )
+            self.__refreshLabel()
+
+
+
+    def elideMode(self) -> QtCore.Qt.TextElideMode:
+        return self.__elide_mode
+
+
+
+    def directText(self) -> bool:
+        return self.__direct_text
+
+    
+
+    def textBold(self) -> bool:
+        return self.__text_font.bold()
+
+
+
+    def enteredGradient(self) -> QtGui.QGradient | None:
+        if self.__gradient_dict.get("entered") is None:
+            return None
+        return _copyGradient(self.__gradient_dict.get("entered"))
+
+
+
+    def pressedGradient(self) -> QtGui.QGradient | None:
+        if self.__gradient_dict.get("pressed") is None:
+            return None
+        return _copyGradient(self.__gradient_dict.get("pressed"))
+
+
+
+    def roundedStyle(self) -> RoundedStyle:
+        return super().roundedStyle().replace(
+            background=self.__color_dict.get("standard"),
+            entered=self.__color_dict.get("entered"),
+            pressed=self.__color_dict.get("pressed"),
+            text=self.__color_dict.get("text"),
+            background_gradient=self.__gradient_dict.get("standard"),
+            entered_gradient=self.__gradient_dict.get("entered"),
+            pressed_gradient=self.__gradient_dict.get("pressed")
+        )
 
 
-    def removeTextBold(self) -> None:
-        self.__text_font.setBold(False)
-        super().setFont(self.__text_font)
 
-    
+    def setAnimationDuration(self, msec: int) -> None:
+        if not isinstance(msec, int):
+            raise TypeError("Parameter passed error! The parameter type must be 'int'.")
+        self.__animation_duration = max(0, msec)
+        if self.__animation_duration == 0 and frameClock().isAnimating(self, "background"):
+            frameClock().stop(self, "background")
+            self.__applyState(self.__animation_to)
 
-    def textBold(self) -> bool:
-        return self.__text_font.bold()
+
+
+    def animationDuration(self) -> int:
+        return self.__animation_duration
     
 
 
@@ -710,7 +2653,8 @@ class ShadowFrame(object):
             self, 
             parent: QtWidgets.QWidget | None = None, 
             bind_obj: RoundedWidget | None = None,
-            shadow_width: int | float = None
+            shadow_width: int | float = None,
+            nine_patch: bool = False
         ) -> None:
             super().__init__(parent)
             
@@ -718,9 +2662,14 @@ class ShadowFrame(object):
             self.__bind_obj:        RoundedWidget = bind_obj
             self.__shadow_width:    int | float = shadow_width
             self.__shadow_radiu:    int | float = self.__bind_obj.radius() + self.__shadow_width
-            self.__centers_dict:    dict[str, QtCore.QPointF] = None
             self.__pie_gradient:    QtGui.QRadialGradient = QtGui.QRadialGradient()
             self.__rect_gradient:   QtGui.QLinearGradient = QtGui.QLinearGradient()
+            self.__nine_patch:      bool = nine_patch
+            self.__texture_key:     tuple = None
+            self.__texture:         QtGui.QPixmap = None
+            self.__blur_shadow:     tuple = None
+            self.__blur_key:        tuple = None
+            self.__blur_pixmap:     QtGui.QPixmap = None
 
             ### 初始化 ###
             self.setGeometry(
@@ -729,168 +2678,189 @@ class ShadowFrame(object):
                 self.__bind_obj.width() + 2 * self.__shadow_width,
                 self.__bind_obj.height() + 2 * self.__shadow_width
             )
-            self.__setCenterDict()
             self.setColorAt(0, QtGui.QColor(0, 0, 0, 0))
             self.setColorAt(1, QtGui.QColor(0, 0, 0, 0))
             self.__bind_obj.raise_()
             self.lower()
+            self.__bind_obj.installEventFilter(self)            ### 跟踪绑定控件的位置、尺寸与可见性 ###
+            self.__bind_obj.radiusChanged.connect(self.__radiusChanged)
+            self.__bind_obj.destroyed.connect(self.__bindDestroyed)
 
 
 
         ### private类函数 ###
-        def __setCenterDict(self):
-            if self.__centers_dict is not None:
-                del self.__centers_dict
+        def __bound(self) -> bool:
+            return self.__bind_obj is not None and not sip.isdeleted(self.__bind_obj)
 
-            above = self.__shadow_radiu
-            below = self.height() - self.__shadow_radiu
-            left = self.__shadow_radiu
-            right = self.width() - self.__shadow_radiu
-            self.__centers_dict: dict[str, QtCore.QPointF] = {
-                "upperL": QtCore.QPointF(left, above),
-                "upperR": QtCore.QPointF(right, above),
-                "lowerL": QtCore.QPointF(left, below),
-                "lowerR": QtCore.QPointF(right, below)
-            }
 
 
+        def __bindDestroyed(self) -> None:
+            ### 绑定控件被销毁后解除绑定并隐藏阴影，之后仍可重新绑定 ###
+            self.__bind_obj = None
+            self.hide()
 
-        ### 重写类函数 ###
-        def paintEvent(self, a0: QtGui.QPaintEvent) -> None:
-            painter = QtGui.QPainter(self)
-            painter.setPen(QtGui.QColor(QtCore.Qt.transparent))
-            painter.setRenderHint(QtGui.QPainter.Antialiasing)
-
-            pie_rect_width = 2 * self.__shadow_radiu
-            self.__pie_gradient.setCenterRadius(self.__shadow_radiu)
-
-            self.__pie_gradient.setCenter(self.__centers_dict.get("upperL"))
-            self.__pie_gradient.setFocalPoint(self.__centers_dict.get("upperL"))
-            painter.setBrush(self.__pie_gradient)
-            painter.drawPie(
-                QtCore.QRectF(
-                    self.__centers_dict.get("upperL").x() - self.__shadow_radiu,
-                    self.__centers_dict.get("upperL").y() - self.__shadow_radiu,
-                    pie_rect_width, 
-                    pie_rect_width
-                ),
-                90 * 16,
-                90 * 16
-            )
 
-            self.__pie_gradient.setCenter(self.__centers_dict.get("upperR"))
-            self.__pie_gradient.setFocalPoint(self.__centers_dict.get("upperR"))
-            painter.setBrush(self.__pie_gradient)
-            painter.drawPie(
-                QtCore.QRectF(
-                    self.__centers_dict.get("upperR").x() - self.__shadow_radiu,
-                    self.__centers_dict.get("upperR").y() - self.__shadow_radiu,
-                    pie_rect_width, 
-                    pie_rect_width
-                ),
-                0 * 16,
-                90 * 16
-            )
 
-            self.__pie_gradient.setCenter(self.__centers_dict.get("lowerL"))
-            self.__pie_gradient.setFocalPoint(self.__centers_dict.get("lowerL"))
-            painter.setBrush(self.__pie_gradient)
-            painter.drawPie(
-                QtCore.QRectF(
-                    self.__centers_dict.get("lowerL").x() - self.__shadow_radiu,
-                    self.__centers_dict.get("lowerL").y() - self.__shadow_radiu,
-                    pie_rect_width, 
-                    pie_rect_width
-                ),
-                180 * 16,
-                90 * 16
-            )
+        def __radiusChanged(self, radius: float) -> None:
+            self.__shadow_radiu = self.__bind_obj.radius() + self.__shadow_width
+            self.setStops(self.__rect_gradient.stops())         ### 只重新映射扇形渐变的位置 ###
 
-            self.__pie_gradient.setCenter(self.__centers_dict.get("lowerR"))
-            self.__pie_gradient.setFocalPoint(self.__centers_dict.get("lowerR"))
-            painter.setBrush(self.__pie_gradient)
-            painter.drawPie(
-                QtCore.QRectF(
-                    self.__centers_dict.get("lowerR").x() - self.__shadow_radiu,
-                    self.__centers_dict.get("lowerR").y() - self.__shadow_radiu,
-                    pie_rect_width, 
-                    pie_rect_width
-                ),
-                270 * 16,
-                90 * 16
-            )
 
-            self.__rect_gradient.setStart(self.__shadow_width, 0)
-            self.__rect_gradient.setFinalStop(0, 0)
-            painter.setBrush(self.__rect_gradient)
-            painter.drawRect(
-                QtCore.QRectF(
-                    0, 
-                    self.__centers_dict.get("upperL").y(), 
-                    self.__shadow_width, 
-                    self.__bind_obj.height() - 2 * self.__bind_obj.radius()
-                )
+
+        def __drawShadow(self, painter: QtGui.QPainter, width: int | float, height: int | float) -> None:
+            drawShadow(
+                painter, 
+                width, 
+                height, 
+                self.__shadow_radiu - self.__shadow_width, 
+                self.__shadow_width, 
+                self.__rect_gradient, 
+                self.__pie_gradient
             )
 
-            self.__rect_gradient.setStart(0, self.__shadow_width)
-            self.__rect_gradient.setFinalStop(0, 0)
-            painter.setBrush(self.__rect_gradient)
-            painter.drawRect(
-                QtCore.QRectF(
-                    self.__centers_dict.get("upperL").x(),
-                    0,
-                    self.__bind_obj.width() - 2 * self.__bind_obj.radius(),
-                    self.__shadow_width
-                )
+
+
+        def __textureKey(self, ratio: float) -> tuple:
+            return _shadowTextureKey(
+                self.__bind_obj.radius(), 
+                self.__shadow_width, 
+                ratio, 
+                self.__rect_gradient.stops()
             )
 
-            self.__rect_gradient.setStart(self.width() - self.__shadow_width, 0)
-            self.__rect_gradient.setFinalStop(self.width(), 0)
-            painter.setBrush(self.__rect_gradient)
-            painter.drawRect(
-                QtCore.QRectF(
-                    self.width() - self.__shadow_width,
-                    self.__centers_dict.get("upperR").y(),
-                    self.__shadow_width, 
-                    self.__bind_obj.height() - 2 * self.__bind_obj.radius()
-                )
+
+
+        def __renderTexture(self, ratio: float) -> QtGui.QPixmap:
+            size = 2 * self.__shadow_radiu + 1
+            texture = QtGui.QPixmap(int(size * ratio + 0.999), int(size * ratio + 0.999))
+            texture.setDevicePixelRatio(ratio)
+            texture.fill(QtCore.Qt.transparent)
+
+            painter = QtGui.QPainter(texture)
+            self.__drawShadow(painter, size, size)
+            painter.end()
+            return texture
+
+
+
+        def __paintNinePatch(self, painter: QtGui.QPainter) -> None:
+            ratio = self.devicePixelRatioF()
+            if (
+                self.__texture_key is None or 
+                self.__texture_key[1] != self.__bind_obj.radius() or 
+                self.__texture_key[3] != ratio
+            ):
+                self.__texture_key = self.__textureKey(ratio)
+                self.__texture = _shared_render_cache.find(self.__texture_key)
+                if self.__texture is None:
+                    self.__texture = self.__renderTexture(ratio)
+                    _shared_render_cache.insert(self.__texture_key, self.__texture)
+
+            _drawNinePatch(
+                painter, 
+                self.__texture, 
+                self.width(), 
+                self.height(), 
+                self.__shadow_radiu - self.__shadow_width, 
+                self.__shadow_width, 
+                ratio
             )
-            
-            self.__rect_gradient.setStart(0, self.height() - self.__shadow_width)
-            self.__rect_gradient.setFinalStop(0, self.height())
-            painter.setBrush(self.__rect_gradient)
-            painter.drawRect(
-                QtCore.QRectF(
-                    self.__centers_dict.get("lowerL").x(),
-                    self.height() - self.__shadow_width,
-                    self.__bind_obj.width() - 2 * self.__bind_obj.radius(),
-                    self.__shadow_width
-                )
+
+
+
+        def __paintBlur(self, painter: QtGui.QPainter) -> None:
+            blur, spread, color, offset = self.__blur_shadow
+            size = (self.__bind_obj.width(), self.__bind_obj.height())
+            ratio = self.devicePixelRatioF()
+            key = _blurShadowKey(size, self.__bind_obj.radius(), blur, spread, color, ratio)
+            if key != self.__blur_key:
+                self.__blur_key = key
+                self.__blur_pixmap = _blurShadowPixmap(size, self.__bind_obj.radius(), blur, spread, color, ratio)
+
+            painter.drawPixmap(
+                QtCore.QPointF(
+                    self.__shadow_width - blur - spread + offset[0], 
+                    self.__shadow_width - blur - spread + offset[1]
+                ), 
+                self.__blur_pixmap
             )
 
+
+
+        ### 重写类函数 ###
+        def eventFilter(self, a0: QtCore.QObject, a1: QtCore.QEvent) -> bool:
+            if a0 is self.__bind_obj:
+                match a1.type():
+                    case QtCore.QEvent.Move:
+                        self.move(
+                            self.__bind_obj.x() - self.__shadow_width, 
+                            self.__bind_obj.y() - self.__shadow_width
+                        )
+                    case QtCore.QEvent.Resize:
+                        self.resize(
+                            self.__bind_obj.width() + 2 * self.__shadow_width, 
+                            self.__bind_obj.height() + 2 * self.__shadow_width
+                        )
+                    case QtCore.QEvent.Show:
+                        self.show()
+                    case QtCore.QEvent.Hide:
+                        self.hide()
+            return super().eventFilter(a0, a1)
+
+
+
+        @_profiledPaint
+        def paintEvent(self, a0: QtGui.QPaintEvent) -> None:
+            if not self.__bound():
+                return super().paintEvent(a0)
+            painter = QtGui.QPainter(self)
+            if self.__blur_shadow is not None:
+                self.__paintBlur(painter)
+            elif self.__nine_patch:
+                self.__paintNinePatch(painter)
+            else:
+                self.__drawShadow(painter, self.width(), self.height())
             return super().paintEvent(a0)
             
 
 
         ### 定义类函数 ###
         def setColorAt(self, pos, color) -> None:
+            if not self.__bound():
+                return
             a = self.__bind_obj.radius() / self.__shadow_radiu
             b = self.__shadow_width / self.__shadow_radiu
             self.__rect_gradient.setColorAt(pos, color)
             self.__pie_gradient.setColorAt(a + b * pos, color)
+            self.__texture_key = None
             self.update()
         
 
 
-        def clearGradient(self) -> None:
-            del self.__pie_gradient, self.__rect_gradient
-            self.__pie_gradient = QtGui.QRadialGradient()
-            self.__rect_gradient = QtGui.QLinearGradient()
+        def setStops(self, stops: list) -> None:
+            if not self.__bound():
+                return
+            a = self.__bind_obj.radius() / self.__shadow_radiu
+            b = self.__shadow_width / self.__shadow_radiu
+            self.__rect_gradient.setStops(stops)
+            self.__pie_gradient.setStops([(a + b * pos, color) for pos, color in stops])
+            self.__texture_key = None
+            self.update()
+
+
+
+        def setNinePatchEnabled(self, judge: bool) -> None:
+            self.__nine_patch = judge
+            self.__texture_key = None
+            self.__texture = None
+            self.update()
 
 
 
         def setShadowWidth(self, width: int | float) -> None:
             self.__shadow_width = width
+            if not self.__bound():
+                return
             self.__shadow_radiu = self.__bind_obj.radius() + self.__shadow_width
             self.setGeometry(
                 self.__bind_obj.x() - self.__shadow_width,
@@ -898,11 +2868,28 @@ class ShadowFrame(object):
                 self.__bind_obj.width() + 2 * self.__shadow_width,
                 self.__bind_obj.height() + 2 * self.__shadow_width
             )
-            self.__setCenterDict()
+            self.setStops(self.__rect_gradient.stops())
+
+
+
+        def setBlurShadow(self, blur_shadow: tuple | None) -> None:
+            self.__blur_shadow = blur_shadow
+            self.__blur_key = None
+            self.__blur_pixmap = None
             self.update()
 
 
 
+        def unbind(self) -> None:
+            if not self.__bound():
+                return
+            self.__bind_obj.removeEventFilter(self)
+            self.__bind_obj.radiusChanged.disconnect(self.__radiusChanged)
+            self.__bind_obj.destroyed.disconnect(self.__bindDestroyed)
+            self.__bind_obj = None
+
+
+
     ### ========================================================================================================= ###
 
 
@@ -936,23 +2923,32 @@ class ShadowFrame(object):
         self.__parent:          QtWidgets.QWidget = parent
         self.__shadow:          self.__ShadowPainter = None
         self.__shadow_width:    int | float = 15
-
-        self.__gradient_color_list: list = [
-            [0, QtGui.QColor(0, 0, 0, 0)],
-            [1, QtGui.QColor(0, 0, 0, 0)]
-        ]
+        self.__nine_patch:      bool = False
+        self.__bind_obj:        RoundedWidget = bind_obj
+        self.__batch_depth:     int = 0
+        self.__batch_flash:     bool = False
+        self.__batch_geometry:  bool = False
+        self.__blur_shadow:     tuple = None
+        self.__plain_width:     int | float = None          # 开启模糊阴影前的阴影宽度，清除时恢复
+
+        self.__stop_positions:  list[float] = [0, 1]
+        self.__stop_colors:     dict[float, QtGui.QColor] = {
+            0: QtGui.QColor(0, 0, 0, 0),
+            1: QtGui.QColor(0, 0, 0, 0)
+        }
         
         ### 初始化 ###
         if bind_obj is not None and parent is not None:
-            self.__shadow = self.__ShadowPainter(parent, bind_obj, self.__shadow_width)
+            self.__shadow = self.__ShadowPainter(parent, bind_obj, self.__shadow_width, self.__nine_patch)
 
 
 
     ### private类函数 ###
     def __flash(self) -> None:
-        self.__shadow.clearGradient()
-        for i in range(len(self.__gradient_color_list)):
-            self.__shadow.setColorAt(self.__gradient_color_list[i][0], self.__gradient_color_list[i][1])
+        if self.__batch_depth > 0:
+            self.__batch_flash = True
+            return
+        self.__shadow.setStops([(pos, self.__stop_colors[pos]) for pos in self.__stop_positions])
 
 
 
@@ -964,9 +2960,12 @@ class ShadowFrame(object):
             raise AttributeError("The 'parent' of the frame is None")
         
         if self.__shadow is not None:
+            self.__shadow.unbind()
             self.__shadow.deleteLater()
             del self.__shadow
-        self.__shadow = self.__ShadowPainter(self.__parent, bind_obj, self.__shadow_width)
+        self.__bind_obj = bind_obj
+        self.__shadow = self.__ShadowPainter(self.__parent, bind_obj, self.__shadow_width, self.__nine_patch)
+        self.__shadow.setBlurShadow(self.__blur_shadow)
         self.__flash()
     
 
@@ -988,7 +2987,6 @@ class ShadowFrame(object):
         elif self.__shadow is None:
             raise AttributeError("The 'bind_obj' of the frame is None")
         
-        judge = True
         position = pos
 
         if pos < 0: 
@@ -996,15 +2994,17 @@ class ShadowFrame(object):
         elif pos > 1: 
             position = 1
 
-        for i in range(len(self.__gradient_color_list)):
-            if position == self.__gradient_color_list[i][0]:
-                self.__gradient_color_list[i][1] = QtGui.QColor(color)
-                judge = False
-                break
-        if judge:
-            self.__gradient_color_list.append(list([position, QtGui.QColor(color)]))
+        old = self.__stop_colors.get(position)
+        if old is not None and old.rgba() == color.rgba():
+            return
+        if old is None:
+            bisect.insort(self.__stop_positions, position)
+        self.__stop_colors[position] = QtGui.QColor(color)
 
-        self.__flash()
+        if self.__batch_depth > 0:
+            self.__batch_flash = True
+        else:
+            self.__shadow.setColorAt(position, self.__stop_colors[position])
 
 
 
@@ -1020,13 +3020,114 @@ class ShadowFrame(object):
             self.__shadow_width = 0
         else:
             self.__shadow_width = width
-        self.__shadow.setShadowWidth(self.__shadow_width)
-        self.__flash()
+        if self.__batch_depth > 0:
+            self.__batch_geometry = True
+        else:
+            self.__shadow.setShadowWidth(self.__shadow_width)
     
 
 
     def shadowWidth(self) -> int | float:
         return self.__shadow_width
+
+
+
+    def colorStops(self) -> list[tuple[float, QtGui.QColor]]:
+        return [(pos, QtGui.QColor(self.__stop_colors[pos])) for pos in self.__stop_positions]
+
+
+
+    def bindObject(self) -> RoundedWidget | None:
+        if self.__bind_obj is not None and sip.isdeleted(self.__bind_obj):
+            return None
+        return self.__bind_obj
+
+
+
+    def setNinePatchEnabled(self, judge: bool) -> None:
+        if not isinstance(judge, bool):
+            raise TypeError("Parameter passed error! The parameter type must be 'bool'.")
+        self.__nine_patch = judge
+        if self.__shadow is not None:
+            self.__shadow.setNinePatchEnabled(judge)
+
+
+
+    def ninePatchEnabled(self) -> bool:
+        return self.__nine_patch
+
+
+
+    def setBlurShadow(
+        self, 
+        blur: int, 
+        spread: int = 0, 
+        color: QtGui.QColor | None = None, 
+        offset: tuple[int, int] = (0, 0)
+    ) -> None:
+        if not (isinstance(blur, int) and isinstance(spread, int)):
+            raise TypeError("Parameter passed error! The parameter type must be 'int'.")
+        elif color is not None and not isinstance(color, QtGui.QColor):
+            raise TypeError("Parameter passed error! The parameter type must be 'QColor'.")
+        elif not (
+            isinstance(offset, tuple) and 
+            len(offset) == 2 and 
+            isinstance(offset[0], int) and 
+            isinstance(offset[1], int)
+        ):
+            raise TypeError("Parameter passed error! The parameter type must be 'tuple[int, int]'.")
+        elif self.__shadow is None:
+            raise AttributeError("The 'bind_obj' of the frame is None")
+
+        blur = max(0, blur)
+        spread = max(-blur, spread)
+        color = QtGui.QColor(0, 0, 0, 100) if color is None else QtGui.QColor(color)
+        if self.__blur_shadow is None:
+            self.__plain_width = self.__shadow_width
+        self.__blur_shadow = (blur, spread, color, offset)
+
+        ### 阴影宽度自动覆盖模糊、扩散与偏移 ###
+        self.setShadowWidth(blur + spread + max(abs(offset[0]), abs(offset[1])))
+        self.__shadow.setBlurShadow(self.__blur_shadow)
+
+
+
+    def clearBlurShadow(self) -> None:
+        if self.__blur_shadow is None:
+            return
+        self.__blur_shadow = None
+        if self.__shadow is not None:
+            self.__shadow.setBlurShadow(None)
+            self.setShadowWidth(self.__plain_width)
+        else:
+            self.__shadow_width = self.__plain_width
+        self.__plain_width = None
+
+
+
+    def blurShadow(self) -> tuple[int, int, QtGui.QColor, tuple[int, int]] | None:
+        if self.__blur_shadow is None:
+            return None
+        blur, spread, color, offset = self.__blur_shadow
+        return blur, spread, QtGui.QColor(color), offset
+
+
+
+    @contextlib.contextmanager
+    def batchUpdate(self) -> typing.Iterator["ShadowFrame"]:
+        self.__batch_depth += 1
+        try:
+            yield self
+        finally:
+            self.__batch_depth -= 1
+            if self.__batch_depth == 0 and self.__shadow is not None:
+                if self.__batch_geometry:
+                    self.__shadow.setShadowWidth(self.__shadow_width)
+                if self.__batch_flash:
+                    self.__flash()
+            if self.__batch_depth == 0:
+                self.__batch_geometry = False
+                self.__batch_flash = False
     
 
 
@@ -1036,11 +3137,11 @@ class ShadowFrame(object):
         elif self.__shadow is None:
             raise AttributeError("The 'bind_obj' of the frame is None")
         
-        del self.__gradient_color_list
-        self.__gradient_color_list = [
-            [0, QtGui.QColor(0, 0, 0, 0)],
-            [1, QtGui.QColor(0, 0, 0, 0)]
-        ]
+        self.__stop_positions = [0, 1]
+        self.__stop_colors = {
+            0: QtGui.QColor(0, 0, 0, 0),
+            1: QtGui.QColor(0, 0, 0, 0)
+        }
         self.__flash()
 
 
@@ -1048,8 +3149,10 @@ class ShadowFrame(object):
     def deleteLater(self) -> None:
         if self.__shadow is not None:
             self.resetColor()
+            self.__shadow.unbind()
             self.__shadow.deleteLater()
             self.__shadow = None
+            self.__bind_obj = None
                 
 
 
@@ -1077,6 +3180,21 @@ class RoundedWindow(RoundedWidget):
         
         resized:        QtCore.pyqtSignal = QtCore.pyqtSignal()
 
+        ### 各区域对应的光标（None为默认光标） ###
+        __zone_cursors: dict[int, QtCore.Qt.CursorShape | None] = {
+            0: None,
+            1: QtCore.Qt.CursorShape.SizeVerCursor,
+            2: QtCore.Qt.CursorShape.SizeVerCursor,
+            3: QtCore.Qt.CursorShape.SizeHorCursor,
+            4: QtCore.Qt.CursorShape.SizeHorCursor,
+            5: None,
+            6: QtCore.Qt.CursorShape.SizeFDiagCursor,
+            7: QtCore.Qt.CursorShape.SizeBDiagCursor,
+            8: QtCore.Qt.CursorShape.SizeBDiagCursor,
+            9: QtCore.Qt.CursorShape.SizeFDiagCursor
+        }
+        __zone_areas:   dict[int, int] = {1: 1, 2: 2, 3: 3, 4: 4, 6: 6, 7: 7, 8: 8, 9: 9}
+
 
 
         ### -----窗口按钮（私有类）----- ###
@@ -1090,6 +3208,21 @@ class RoundedWindow(RoundedWidget):
                 super().__init__(parent)
                 self.button_state: int = 0        # 0: normal, 1: entered, 2: pressed
                 self.color_list: list = None
+                self.offset: float = 0
+                self.animation_duration: int = 120
+                self.__offset_from: float = 0
+                self.__offset_to: float = 0
+
+
+            def __offsetStep(self, progress: float) -> None:
+                self.offset = self.__offset_from + (self.__offset_to - self.__offset_from) * progress
+                self.update()
+
+
+            def animateOffset(self, target: float) -> None:
+                self.__offset_from = self.offset
+                self.__offset_to = target
+                frameClock().start(self, "offset", self.animation_duration, self.__offsetStep)
                 
 
             def mouseReleaseEvent(self, a0: QtGui.QMouseEvent) -> None:
@@ -1136,6 +3269,7 @@ class RoundedWindow(RoundedWidget):
                 super().__init__(parent)
             
 
+            @_profiledPaint
             def paintEvent(self, a0: QtGui.QPaintEvent) -> None:
                 painter = QtGui.QPainter(self)
                 pen = QtGui.QPen()
@@ -1168,16 +3302,11 @@ class RoundedWindow(RoundedWidget):
 
             def __init__(self, parent: QtWidgets.QWidget) -> None:
                 super().__init__(parent)
-                self.timer:       QtCore.QTimer = QtCore.QTimer(self)
-                self.offset:      int = 0
-                self.count:       int = 0
-
-                self.timer.setInterval(20)
-                self.entered.connect(self.timer.start)
-                self.left.connect(self.timer.start)
-                self.timer.timeout.connect(self.__flush)
+                self.entered.connect(self.__sink)
+                self.left.connect(self.__rise)
 
 
+            @_profiledPaint
             def paintEvent(self, a0: QtGui.QPaintEvent) -> None:
                 painter = QtGui.QPainter(self)
                 pen = QtGui.QPen()
@@ -1196,25 +3325,12 @@ class RoundedWindow(RoundedWidget):
                 return super().paintEvent(a0)
             
 
-            def __flush(self) -> None:
-                if self.count == 6:
-                    self.timer.stop()
-                    self.count = 0
-                    
-                    if self.button_state == 1:
-                        self.offset = 6
-                    else:
-                        self.offset = 0
-                    self.update()
-                    return
-                
-                if self.button_state == 1:
-                    self.offset += 1
-                elif self.offset > 0:
-                    self.offset -= 1
+            def __sink(self) -> None:
+                self.animateOffset(6)
 
-                self.count += 1
-                self.update()
+
+            def __rise(self) -> None:
+                self.animateOffset(0)
         
 
 
@@ -1230,6 +3346,7 @@ class RoundedWindow(RoundedWidget):
                 self.__change_icon = False
 
 
+            @_profiledPaint
             def paintEvent(self, a0: QtGui.QPaintEvent) -> None:
                 painter = QtGui.QPainter(self)
                 pen = QtGui.QPen()
@@ -1277,6 +3394,38 @@ class RoundedWindow(RoundedWidget):
 
 
 
+        ### -----缩放轮廓（私有类）----- ###
+        class __ResizeOutline(QtWidgets.QWidget):
+
+            def __init__(self, parent: QtWidgets.QWidget) -> None:
+                super().__init__(
+                    parent,             ### Tool窗口：独立的顶层窗口，随框架一起销毁 ###
+                    QtCore.Qt.FramelessWindowHint | QtCore.Qt.Tool | QtCore.Qt.WindowStaysOnTopHint
+                )
+                self.pixmap: QtGui.QPixmap = None
+                self.radius: int | float = 0
+                self.outline_color: QtGui.QColor = QtGui.QColor(100, 150, 255)
+                self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
+                self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
+                self.setAttribute(QtCore.Qt.WA_ShowWithoutActivating)
+
+
+            def paintEvent(self, a0: QtGui.QPaintEvent) -> None:
+                painter = QtGui.QPainter(self)
+                painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+                if self.pixmap is not None:
+                    painter.drawPixmap(self.rect(), self.pixmap)        ### 拖动期间只缩放按下时的快照 ###
+                painter.setPen(QtGui.QPen(self.outline_color, 2))
+                painter.setBrush(QtCore.Qt.NoBrush)
+                painter.drawRoundedRect(QtCore.QRectF(self.rect()).adjusted(1, 1, -1, -1), self.radius, self.radius)
+                return super().paintEvent(a0)
+
+
+
+        ### ========================================================================================================= ###
+
+
+
         ### 构造函数（__Frame） ###
         def __init__(self, window_style: int = None) -> None:
             super().__init__()
@@ -1286,8 +3435,16 @@ class RoundedWindow(RoundedWidget):
             self.__mouse_global_pos:        QtCore.QPoint = None
             self.__mouse_pressed:           bool = False
             self.__geometry_disabled:       bool = False
-            self.__pressed_area:            int = 0      # 0: None, 1: above, 2: below, 3: left, 4: right, 5: move area
+            self.__pressed_area:            int = 0      # 0: None, 1: above, 2: below, 3: left, 4: right, 5: move area, 6-9: corners
+            self.__hover_zone:              int = None   # 同上，6: 左上, 7: 右上, 8: 左下, 9: 右下
+            self.__zone_key:                tuple = None
+            self.__zone_rects:              list[tuple[QtCore.QRect, int]] = []
             self.__original_size:           QtCore.QSize = None
+            self.__original_pos:            QtCore.QPoint = None
+            self.__pending_geometry:        QtCore.QRect = None
+            self.__resize_timer:            QtCore.QTimer = QtCore.QTimer(self)
+            self.__resize_clock:            QtCore.QElapsedTimer = QtCore.QElapsedTimer()
+            self.__outline:                 self.__ResizeOutline = None
             self.__close_button:            self.__CloseButton = self.__CloseButton(self)
             self.__max_button:              self.__MaximizeButton = self.__MaximizeButton(self)
             self.__min_button:              self.__MinimizeButton = self.__MinimizeButton(self)
@@ -1296,9 +3453,12 @@ class RoundedWindow(RoundedWidget):
             ### public属性 ###
             self.move_area_width:           int = 24
             self.resize_area_width:         int = 5
+            self.corner_area_width:         int = 12
             self.win_button_offset:         int = 10
             self.enable_resize:             bool = True
             self.frame_radius:              int | float = 25
+            self.resize_frame_rate:         int = 60
+            self.outline_resize:            bool = False
 
 
             ### 初始化 ###
@@ -1310,6 +3470,8 @@ class RoundedWindow(RoundedWidget):
             self.setWindowFlags(QtCore.Qt.FramelessWindowHint)
             self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
             self.setMinimumSize(0, 0)
+            self.__resize_timer.setSingleShot(True)
+            self.__resize_timer.timeout.connect(self.__applyPendingGeometry)
 
             self.__close_button.entered.connect(self.__geometryDisabled)
             self.__close_button.left.connect(self.__geometryEnabled)
@@ -1324,20 +3486,144 @@ class RoundedWindow(RoundedWidget):
 
 
         ### private类函数 ###
+        def __zoneRects(self) -> list[tuple[QtCore.QRect, int]]:
+            key = (
+                self.width(), 
+                self.height(), 
+                self.resize_area_width, 
+                self.move_area_width, 
+                self.corner_area_width, 
+                self.enable_resize
+            )
+            if key == self.__zone_key:
+                return self.__zone_rects
+
+            w, h, r, m, c, resizable = key
+            rects = []
+            if resizable:
+                rects += [
+                    (QtCore.QRect(0, 0, c, c), 6),
+                    (QtCore.QRect(w - c, 0, c, c), 7),
+                    (QtCore.QRect(0, h - c, c, c), 8),
+                    (QtCore.QRect(w - c, h - c, c, c), 9),
+                    (QtCore.QRect(0, 0, w, r + 1), 1),
+                    (QtCore.QRect(0, h - r, w, r), 2),
+                    (QtCore.QRect(0, 0, r + 1, h), 3),
+                    (QtCore.QRect(w - r, 0, r, h), 4)
+                ]
+            rects.append((QtCore.QRect(0, r + 1, w, m), 5))
+            self.__zone_key = key
+            self.__zone_rects = rects
+            return rects
+
+
+
+        def __zoneAt(self, pos: QtCore.QPoint) -> int:
+            for rect, zone in self.__zoneRects():
+                if rect.contains(pos):
+                    return zone
+            return 0
+
+
+
         def __setCursor(self, a0: QtGui.QMouseEvent) -> None:
-            if not self.isMaximized():
-                if (a0.y() <= self.resize_area_width or a0.y() >= self.height() - self.resize_area_width) and self.enable_resize:
-                    self.setCursor(QtCore.Qt.CursorShape.SizeVerCursor)
-                elif (a0.x() <= self.resize_area_width or a0.x() >= self.width() - self.resize_area_width) and self.enable_resize:
-                    self.setCursor(QtCore.Qt.CursorShape.SizeHorCursor)
-                elif self.resize_area_width < a0.y() <= self.move_area_width + self.resize_area_width:
-                    self.unsetCursor()
-                else:
-                    self.unsetCursor()
-                    self.__geometryDisabled()
-                    return
+            if self.isMaximized():
+                return
+
+            zone = self.__zoneAt(a0.pos())
+            if zone == 0:               ### 窗口按钮的entered/left也会修改该标志，每次都要同步 ###
+                self.__geometryDisabled()
+            else:
                 self.__geometryEnabled()
 
+            if zone == self.__hover_zone:
+                return          ### 区域未变化时不再调用setCursor ###
+            self.__hover_zone = zone
+
+            cursor = self.__zone_cursors.get(zone)
+            if cursor is None:
+                self.unsetCursor()
+            else:
+                self.setCursor(cursor)
+
+
+
+        def __dragGeometry(self, a0: QtGui.QMouseEvent) -> QtCore.QRect:
+            dx = a0.globalX() - self.__mouse_global_pos.x()
+            dy = a0.globalY() - self.__mouse_global_pos.y()
+            x = self.__original_pos.x()
+            y = self.__original_pos.y()
+            w = self.__original_size.width()
+            h = self.__original_size.height()
+
+            match self.__pressed_area:
+                case 1 | 6 | 7:     # above resize
+                    h = min(max(h - dy, self.minimumHeight()), self.maximumHeight())
+                    y = self.__original_pos.y() + self.__original_size.height() - h
+                case 2 | 8 | 9:     # below resize
+                    h = min(max(h + dy, self.minimumHeight()), self.maximumHeight())
+
+            match self.__pressed_area:
+                case 3 | 6 | 8:     # left resize
+                    w = min(max(w - dx, self.minimumWidth()), self.maximumWidth())
+                    x = self.__original_pos.x() + self.__original_size.width() - w
+                case 4 | 7 | 9:     # right resize
+                    w = min(max(w + dx, self.minimumWidth()), self.maximumWidth())
+
+            return QtCore.QRect(x, y, w, h)
+
+
+
+        def __scheduleGeometry(self, rect: QtCore.QRect) -> None:
+            self.__pending_geometry = rect
+            if self.resize_frame_rate <= 0:
+                self.__applyPendingGeometry()
+                return
+            if self.__resize_timer.isActive():
+                return
+
+            interval = 1000 / self.resize_frame_rate
+            if not self.__resize_clock.isValid() or self.__resize_clock.elapsed() >= interval:
+                self.__applyPendingGeometry()
+            else:
+                self.__resize_timer.start(int(interval - self.__resize_clock.elapsed()))
+
+
+
+        def __applyPendingGeometry(self) -> None:
+            self.__resize_timer.stop()
+            if self.__pending_geometry is None:
+                return
+
+            rect = self.__pending_geometry
+            self.__pending_geometry = None
+            self.__resize_clock.start()
+
+            if rect.size() == self.size():
+                self.move(rect.x(), rect.y())
+            elif rect.topLeft() == self.pos():
+                self.resize(rect.width(), rect.height())
+            else:
+                self.setGeometry(rect.x(), rect.y(), rect.width(), rect.height())
+
+
+
+        def __showOutline(self, rect: QtCore.QRect) -> None:
+            if self.__outline is None:
+                self.__outline = self.__ResizeOutline(self)
+            if not self.__outline.isVisible():
+                self.__outline.pixmap = self.grab()
+                self.__outline.radius = self.radius()
+            self.__outline.setGeometry(rect)
+            self.__outline.show()
+
+
+
+        def __hideOutline(self) -> None:
+            if self.__outline is not None:
+                self.__outline.hide()
+                self.__outline.pixmap = None
+
 
 
         def __geometryDisabled(self) -> None:
@@ -1365,6 +3651,7 @@ class RoundedWindow(RoundedWidget):
             super().showMaximized()
             self.setRadius(0)
             self.unsetCursor()
+            self.__hover_zone = None
             self.setButtonPosition()
             self.resized.emit()
 
@@ -1395,8 +3682,9 @@ class RoundedWindow(RoundedWidget):
 
 
         def setGeometry(self, ax: int, ay: int, aw: int, ah: int) -> None:
-            self.move(ax, ay)
-            self.resize(aw, ah)
+            super().setGeometry(ax, ay, aw, ah)         ### 一次完成移动与缩放，只触发一次布局与重绘 ###
+            self.setButtonPosition()
+            self.resized.emit()
         
 
 
@@ -1448,33 +3736,29 @@ class RoundedWindow(RoundedWidget):
             self.__mouse_pos = QtCore.QPoint(a0.pos())
             self.__mouse_global_pos = QtCore.QPoint(a0.globalPos())
             self.__original_size = QtCore.QSize(self.size())
+            self.__original_pos = QtCore.QPoint(self.pos())
             
-            if (
-                self.resize_area_width < a0.y() <= self.move_area_width + self.resize_area_width and
-                self.resize_area_width < a0.x() < self.width() - self.resize_area_width and
-                a0.button() == QtCore.Qt.MouseButton.LeftButton
-            ):
+            zone = self.__zoneAt(a0.pos())
+            if zone == 5 and a0.button() == QtCore.Qt.MouseButton.LeftButton:
                 self.__pressed_area = 5
-
-            elif self.enable_resize:
-                if a0.y() <= self.resize_area_width:
-                    self.__pressed_area = 1
-                elif a0.y() >= self.height() - self.resize_area_width:
-                    self.__pressed_area = 2
-                elif a0.x() <= self.resize_area_width:
-                    self.__pressed_area = 3
-                elif a0.x() >= self.width() - self.resize_area_width:
-                    self.__pressed_area = 4
+            elif zone in self.__zone_areas:
+                self.__pressed_area = self.__zone_areas[zone]
 
             return super().mousePressEvent(a0)
 
 
 
         def mouseReleaseEvent(self, a0: QtGui.QMouseEvent) -> None:
+            if self.__mouse_pressed and self.__pressed_area in self.__zone_areas:
+                self.__pending_geometry = self.__dragGeometry(a0)
+            self.__hideOutline()
+            self.__applyPendingGeometry()
+
             self.__mouse_pressed = False
             self.__mouse_pos = None
             self.__pressed_area = 0
             self.__original_size = None
+            self.__original_pos = None
             self.__setCursor(a0)
             return super().mouseReleaseEvent(a0)
         
@@ -1492,39 +3776,11 @@ class RoundedWindow(RoundedWidget):
                         a0.globalY() - self.__mouse_pos.y()
                     )
 
-                case 1:     # above resize
-                    if self.height() != self.minimumHeight() and self.height() != self.maximumHeight():
-                        self.move(
-                            self.x(),
-                            a0.globalY() - self.__mouse_pos.y()
-                        )
-                    self.resize(
-                        self.__original_size.width(),
-                        self.__original_size.height() - (a0.globalY() - self.__mouse_global_pos.y())
-                    )
-
-                case 2:     # below resize
-                    self.resize(
-                        self.__original_size.width(),
-                        self.__original_size.height() + (a0.globalY() - self.__mouse_global_pos.y())
-                    )
-
-                case 3:     # left resize
-                    if self.width() != self.minimumWidth() and self.width() != self.maximumWidth():
-                        self.move(
-                            a0.globalX() - self.__mouse_pos.x(),
-                            self.y()
-                        )
-                    self.resize(
-                        self.__original_size.width() - (a0.globalX() - self.__mouse_global_pos.x()),
-                        self.__original_size.height()
-                    )
-
-                case 4:     # right resize
-                    self.resize(
-                        self.__original_size.width() + (a0.globalX() - self.__mouse_global_pos.x()),
-                        self.__original_size.height()
-                    )
+                case 1 | 2 | 3 | 4 | 6 | 7 | 8 | 9:     # resize
+                    if self.outline_resize:
+                        self.__showOutline(self.__dragGeometry(a0))       ### 松开鼠标时才真正设置几何 ###
+                    else:
+                        self.__scheduleGeometry(self.__dragGeometry(a0))
 
             return super().mouseMoveEvent(a0)
         
@@ -1601,7 +3857,7 @@ class RoundedWindow(RoundedWidget):
     @typing.overload
     def __init__(self) -> None: pass
     @typing.overload
-    def __init__(self, window_style: int | None = ...) -> None: pass
+    def __init__(self, window_style: int | None = ..., *, lazy: bool = ...) -> None: pass
 
     @typing.overload
     def frameResize(self, a0: QtCore.QSize) -> None: pass
@@ -1646,29 +3902,75 @@ class RoundedWindow(RoundedWidget):
 
     
     ### 构造函数（RoundedWindow） ###
-    def __init__(self, a0 = None) -> None:
+    def __init__(self, a0 = None, *, lazy: bool = False) -> None:
+        if not isinstance(lazy, bool):
+            raise TypeError("Parameter passed error! The parameter type must be 'bool'.")
         super().__init__()
         
         ### private属性 ###
-        self.__frame:           self.__Frame = self.__Frame(a0)
+        self.__frame:           self.__Frame = None
+        self.__window_style:    int | None = a0
+        self.__pending:         list = []
         self.__offset_w:        int = None
         self.__offset_h:        int = None
         
 
         ### 初始化 ###
-        self.setParent(self.__frame)
         super().setRadius(0)
         super().setBottomWidth(0)
         super().setBottomVisible(False)
         super().setBackgroundColor(0, 0, 0, 0)
-        self.__frame.resized.connect(self.__setPosition)
-        self.__frame.resize(500, 400)
-        self.__offset_w = self.__frame.width() - self.width()
-        self.__offset_h = self.__frame.height() - self.height()
+        if not lazy:
+            self.__construct()
         
 
 
     ### private类函数 ###
+    def __construct(self) -> None:
+        ### 延迟模式下，框架、窗口按钮及其计时器在首次show()或几何查询时才创建 ###
+        if self.__frame is not None:
+            return
+
+        self.__frame = self.__Frame(self.__window_style)
+        self.setParent(self.__frame)
+        self.__frame.resized.connect(self.__setPosition)
+        self.__frame.resize(500, 400)
+        self.__offset_w = self.__frame.width() - QtWidgets.QWidget.width(self)
+        self.__offset_h = self.__frame.height() - QtWidgets.QWidget.height(self)
+
+        ### 逐个重放，某一调用出错也不影响其余调用，全部重放后再抛出第一个异常 ###
+        pending, self.__pending = self.__pending, []
+        error = None
+        for method, args in pending:
+            try:
+                method(*args)
+            except Exception as e:
+                if error is None:
+                    error = e
+        if error is not None:
+            raise error
+
+
+
+    @staticmethod
+    def __checkArgs(args: tuple, *signatures: tuple, message: str = "Parameter passed error!") -> None:
+        ### 排队前先在调用处检查参数类型，与立即模式一样当场抛出TypeError ###
+        for signature in signatures:
+            if len(args) == len(signature) and all(isinstance(arg, kind) for arg, kind in zip(args, signature)):
+                return
+        raise TypeError(message)
+
+
+
+    def __deferred(self, method: typing.Callable, *args) -> bool:
+        ### 框架创建前的设置调用按顺序排队，创建后依次重放 ###
+        if self.__frame is not None:
+            return False
+        self.__pending.append((method, args))
+        return True
+
+
+
     def __setPosition(self) -> None:
         y = self.__frame.resize_area_width + self.__frame.move_area_width + 3
         height = (
@@ -1700,22 +4002,56 @@ class RoundedWindow(RoundedWidget):
 
     ### 重写类函数 ###
     def show(self) -> None:
+        self.__construct()
         self.__frame.show()
     
 
 
     def close(self) -> None:
+        if self.__frame is None:
+            return
         self.__frame.close()
+
+
+
+    def geometry(self) -> QtCore.QRect:
+        self.__construct()
+        return super().geometry()
+
+
+
+    def rect(self) -> QtCore.QRect:
+        self.__construct()
+        return super().rect()
+
+
+
+    def size(self) -> QtCore.QSize:
+        self.__construct()
+        return super().size()
+
+
+
+    def width(self) -> int:
+        self.__construct()
+        return super().width()
+
+
+
+    def height(self) -> int:
+        self.__construct()
+        return super().height()
     
 
 
     def resize(self, a0: int | QtCore.QSize, a1: int = None) -> None:
+        self.__checkArgs((a0, a1), (int, int), (QtCore.QSize, type(None)))
+        if self.__deferred(self.resize, a0, a1):
+            return
         if isinstance(a0, int) and isinstance(a1, int):
             self.__frame.resize(a0 + self.__offset_w, a1 + self.__offset_h)
-        elif isinstance(a0, QtCore.QSize) and a1 is None:
-            self.__frame.resize(a0.width() + self.__offset_w, a0.height() + self.__offset_h)
         else:
-            raise TypeError("Parameter passed error!")
+            self.__frame.resize(a0.width() + self.__offset_w, a0.height() + self.__offset_h)
     
 
 
@@ -1725,44 +4061,51 @@ class RoundedWindow(RoundedWidget):
             a2: int | None = None, 
             a3: int | None = None
     ) -> None:
+        self.__checkArgs(
+            (a0, a1, a2, a3), 
+            (QtCore.QRect, type(None), type(None), type(None)), 
+            (int, int, int, int)
+        )
+        if self.__deferred(self.setGeometry, a0, a1, a2, a3):
+            return
         
         if isinstance(a0, QtCore.QRect) and a1 is None and a2 is None and a3 is None:
             self.__frame.setGeometry(a0.x(), a0.y(), a0.width(), a0.height())
-        elif isinstance(a0, int) and isinstance(a1, int) and isinstance(a2, int) and isinstance(a3, int):
-            self.__frame.setGeometry(a0, a1, a2, a3)
         else:
-            raise TypeError("Parameter passed error!")
+            self.__frame.setGeometry(a0, a1, a2, a3)
     
 
 
     def setMaximumWidth(self, maxw: int) -> None:
-        if isinstance(maxw, int):
-            self.__frame.setMaximumWidth(maxw + self.__offset_w)
-            self.__setPosition()
-            self.__frame.setButtonPosition()
-        else:
+        if not isinstance(maxw, int):
             raise TypeError("Parameter passed error!")
+        if self.__deferred(self.setMaximumWidth, maxw):
+            return
+        self.__frame.setMaximumWidth(maxw + self.__offset_w)
+        self.__setPosition()
+        self.__frame.setButtonPosition()
     
 
 
     def setMaximumHeight(self, maxh: int) -> None:
-        if isinstance(maxh, int):
-            self.__frame.setMaximumHeight(maxh + self.__offset_h)
-            self.__setPosition()
-            self.__frame.setButtonPosition()
-        else:
+        if not isinstance(maxh, int):
             raise TypeError("Parameter passed error!")
-        self.setMinimumHeight()
+        if self.__deferred(self.setMaximumHeight, maxh):
+            return
+        self.__frame.setMaximumHeight(maxh + self.__offset_h)
+        self.__setPosition()
+        self.__frame.setButtonPosition()
 
 
     
     def setMaximumSize(self, a0: int | QtCore.QSize, a1: int | None = None) -> None:
+        self.__checkArgs((a0, a1), (QtCore.QSize, type(None)), (int, int))
+        if self.__deferred(self.setMaximumSize, a0, a1):
+            return
         if isinstance(a0, QtCore.QSize) and a1 is None:
             self.__frame.setMaximumSize(a0.width() + self.__offset_w, a0.height() + self.__offset_h)
-        elif isinstance(a0, int) and isinstance(a1, int):
-            self.__frame.setMaximumSize(a0 + self.__offset_w, a1 + self.__offset_h)
         else:
-            raise TypeError("Parameter passed error!")
+            self.__frame.setMaximumSize(a0 + self.__offset_w, a1 + self.__offset_h)
         
         self.__setPosition()
         self.__frame.setButtonPosition()
@@ -1770,32 +4113,35 @@ class RoundedWindow(RoundedWidget):
 
 
     def setMinimumWidth(self, minw: int) -> None:
-        if isinstance(minw, int):
-            self.__frame.setMinimumWidth(minw + self.__offset_w)
-            self.__setPosition()
-            self.__frame.setButtonPosition()
-        else:
+        if not isinstance(minw, int):
             raise TypeError("Parameter passed error!")
+        if self.__deferred(self.setMinimumWidth, minw):
+            return
+        self.__frame.setMinimumWidth(minw + self.__offset_w)
+        self.__setPosition()
+        self.__frame.setButtonPosition()
 
 
 
     def setMinimumHeight(self, minh: int) -> None:
-        if isinstance(minh, int):
-            self.__frame.setMinimumHeight(minh + self.__offset_h)
-            self.__setPosition()
-            self.__frame.setButtonPosition()
-        else:
+        if not isinstance(minh, int):
             raise TypeError("Parameter passed error!")
+        if self.__deferred(self.setMinimumHeight, minh):
+            return
+        self.__frame.setMinimumHeight(minh + self.__offset_h)
+        self.__setPosition()
+        self.__frame.setButtonPosition()
     
 
 
     def setMinimumSize(self, a0: int | QtCore.QSize, a1: int | None = None) -> None:
+        self.__checkArgs((a0, a1), (QtCore.QSize, type(None)), (int, int))
+        if self.__deferred(self.setMinimumSize, a0, a1):
+            return
         if isinstance(a0, QtCore.QSize) and a1 is None:
             self.__frame.setMinimumSize(a0.width() + self.__offset_w, a0.height() + self.__offset_h)
-        elif isinstance(a0, int) and isinstance(a1, int):
-            self.__frame.setMinimumSize(a0 + self.__offset_w, a1 + self.__offset_h)
         else:
-            raise TypeError("Parameter passed error!")
+            self.__frame.setMinimumSize(a0 + self.__offset_w, a1 + self.__offset_h)
         
         self.__setPosition()
         self.__frame.setButtonPosition()
@@ -1803,51 +4149,66 @@ class RoundedWindow(RoundedWidget):
 
 
     def isWindow(self) -> bool:
+        self.__construct()
         return self.__frame.isWindow()
 
 
 
     def move(self, a0: int | QtCore.QPoint, a1: int | None = None) -> None:
-        self.__frame.move(a0, a1)
+        self.__checkArgs((a0, a1), (QtCore.QPoint, type(None)), (int, int))
+        if self.__deferred(self.move, a0, a1):
+            return
+        if a1 is None:
+            self.__frame.move(a0)
+        else:
+            self.__frame.move(a0, a1)
     
 
     
     def showMaximized(self) -> None:
+        self.__construct()
         self.__frame.showMaximized()
 
 
 
     def showNormal(self) -> None:
+        self.__construct()
         self.__frame.showNormal()
 
 
 
     def showMinimized(self) -> None:
+        self.__construct()
         self.__frame.showMinimized()
     
 
 
     def isMaximized(self) -> bool:
+        self.__construct()
         return self.__frame.isMaximized()
 
 
 
     def isMinimized(self) -> bool:
+        self.__construct()
         return self.__frame.isMinimized()
     
 
 
     def frameSize(self) -> QtCore.QSize:
+        self.__construct()
         return QtCore.QSize(self.__frame.size())
     
 
 
     def pos(self) -> QtCore.QPoint:
+        self.__construct()
         return QtCore.QPoint(self.__frame.pos())
     
 
 
     def frameGeometry(self) -> QtCore.QRect:
+        self.__construct()
         return QtCore.QRect(self.__frame.geometry())
     
 
@@ -1859,11 +4220,22 @@ class RoundedWindow(RoundedWidget):
         a2: int | None = None, 
         a3: int | None = None
     ) -> None:
+        self.__checkArgs(
+            (a0, a1, a2, a3), 
+            (int, int, int, (int, type(None))), 
+            (QtGui.QColor, type(None), type(None), type(None))
+        )
+        if self.__deferred(self.setBackgroundColor, a0, a1, a2, a3):
+            return
         self.__frame.setBackgroundColor(a0, a1, a2, a3)
     
 
 
     def setBottomVisible(self, judge: bool) -> None:
+        if not isinstance(judge, bool):
+            raise TypeError("Parameter passed error! The parameter type must be 'bool'.")
+        if self.__deferred(self.setBottomVisible, judge):
+            return
         self.__frame.setBottomVisible(judge)
     
 
@@ -1875,36 +4247,52 @@ class RoundedWindow(RoundedWidget):
         a2: int | None = None, 
         a3: int | None = None
     ) -> None:
+        self.__checkArgs(
+            (a0, a1, a2, a3), 
+            (int, int, int, (int, type(None))), 
+            (QtGui.QColor, type(None), type(None), type(None))
+        )
+        if self.__deferred(self.setBottomColor, a0, a1, a2, a3):
+            return
         self.__frame.setBottomColor(a0, a1, a2, a3)
     
 
 
     def setBottomWidth(self, width: int | float) -> None:
+        if not isinstance(width, (int, float)):
+            raise TypeError("Parameter passed error! The parameter type must be 'int' or 'float'.")
+        if self.__deferred(self.setBottomWidth, width):
+            return
         self.__frame.setBottomWidth(width)
     
 
 
     def backgroundColor(self) -> QtGui.QColor:
+        self.__construct()
         return self.__frame.backgroundColor()
     
 
 
     def bottomColor(self) -> QtGui.QColor:
+        self.__construct()
         return self.__frame.bottomColor()
     
 
 
     def backgroundOffset(self) -> tuple:
+        self.__construct()
         return self.__frame.backgroundOffset()
 
 
 
     def bottomOffset(self) -> tuple:
+        self.__construct()
         return self.__frame.bottomOffset()
     
 
 
     def bottomWidth(self) -> int | float:
+        self.__construct()
         return self.__frame.bottomWidth()
     
 
@@ -1916,6 +4304,13 @@ class RoundedWindow(RoundedWidget):
         w: int | float, 
         h: int | float
     ) -> None:
+        self.__checkArgs(
+            (x, y, w, h), 
+            ((int, float), (int, float), (int, float), (int, float)), 
+            message="Parameter passed error! The parameter type must be 'int' or 'float'."
+        )
+        if self.__deferred(self.setBackgroundOffset, x, y, w, h):
+            return
         self.__frame.setBackgroundOffset(x, y, w, h)
     
 
@@ -1927,45 +4322,119 @@ class RoundedWindow(RoundedWidget):
         w: int | float, 
         h: int | float
     ) -> None:
+        self.__checkArgs(
+            (x, y, w, h), 
+            ((int, float), (int, float), (int, float), (int, float)), 
+            message="Parameter passed error! The parameter type must be 'int' or 'float'."
+        )
+        if self.__deferred(self.setBottomOffset, x, y, w, h):
+            return
         self.__frame.setBottomOffset(x, y, w, h)
 
 
 
     def setRadius(self, r: int | float) -> None:
+        if not isinstance(r, (int, float)):
+            raise TypeError("Parameter passed error! The parameter type must be 'int' or 'float'.")
+        if self.__deferred(self.setRadius, r):
+            return
         self.__frame.setRadius(r)
         self.__frame.frame_radius = self.__frame.radius()
     
 
 
     def radius(self) -> int | float:
+        self.__construct()
         return self.__frame.radius()
     
 
 
     def setBackgroundGradient(self, gradient: QtGui.QGradient) -> None:
+        if not isinstance(gradient, QtGui.QGradient):
+            raise TypeError("Parameter passed error! The parameter type must be 'QGradient'.")
+        if self.__deferred(self.setBackgroundGradient, gradient):
+            return
         self.__frame.setBackgroundGradient(gradient)
 
 
 
+    def applyStyle(self, style: RoundedStyle) -> None:
+        if not isinstance(style, RoundedStyle):
+            raise TypeError("Parameter passed error! The parameter type must be 'RoundedStyle'.")
+        if self.__deferred(self.applyStyle, style):
+            return
+        self.__frame.applyStyle(style)
+        self.__frame.frame_radius = self.__frame.radius()
+
+
+
+    def batchUpdate(self) -> typing.ContextManager[RoundedWidget]:
+        self.__construct()
+        return self.__frame.batchUpdate()
+
+
+
     ### 定义类函数 ###
     def frameResize(self, a0: int | QtCore.QSize, a1: int = None) -> None:
+        self.__checkArgs((a0, a1), (int, int), (QtCore.QSize, type(None)))
+        if self.__deferred(self.frameResize, a0, a1):
+            return
         if isinstance(a0, int) and isinstance(a1, int):
             self.__frame.resize(a0, a1)
-        elif isinstance(a0, QtCore.QSize) and a1 is None:
-            self.__frame.resize(a0.width(), a0.height())
         else:
-            raise TypeError("Parameter passed error!")
+            self.__frame.resize(a0.width(), a0.height())
     
 
 
     def resizeAreaWidth(self) -> int:
+        self.__construct()
         return self.__frame.resize_area_width
+
+
+
+    def setResizeFrameRate(self, rate: int) -> None:
+        if not isinstance(rate, int):
+            raise TypeError("Parameter passed error!")
+        if self.__deferred(self.setResizeFrameRate, rate):
+            return
+        if rate >= 0:
+            self.__frame.resize_frame_rate = rate
+        else:
+            self.__frame.resize_frame_rate = 0
+
+
+
+    def resizeFrameRate(self) -> int:
+        self.__construct()
+        return self.__frame.resize_frame_rate
+
+
+
+    def setOutlineResizeEnabled(self, judge: bool) -> None:
+        if not isinstance(judge, bool):
+            raise TypeError("Parameter passed error! The parameter type must be 'bool'.")
+        if self.__deferred(self.setOutlineResizeEnabled, judge):
+            return
+        self.__frame.outline_resize = judge
+
+
+
+    def outlineResizeEnabled(self) -> bool:
+        self.__construct()
+        return self.__frame.outline_resize
+
+
+
+    def isConstructed(self) -> bool:
+        return self.__frame is not None
     
 
 
     def setWinButtonOffset(self, offset: int) -> None:
         if not isinstance(offset, int):
             raise TypeError("Parameter passed error!")
+        if self.__deferred(self.setWinButtonOffset, offset):
+            return
         
         if offset >= 0:
             self.__frame.win_button_offset = offset
@@ -1977,11 +4446,15 @@ class RoundedWindow(RoundedWidget):
     
 
     def enableResize(self) -> None:
+        if self.__deferred(self.enableResize):
+            return
         self.__frame.enable_resize = True
     
 
 
     def disableResize(self) -> None:
+        if self.__deferred(self.disableResize):
+            return
         self.__frame.enable_resize = False
     
 
@@ -1989,6 +4462,8 @@ class RoundedWindow(RoundedWidget):
     def setResizeAreaWidth(self, width: int) -> None:
         if not isinstance(width, int):
             raise TypeError("Parameter passed error!")
+        if self.__deferred(self.setResizeAreaWidth, width):
+            return
         if width >= 0:
             self.__frame.resize_area_width = width
         else:
@@ -1997,11 +4472,13 @@ class RoundedWindow(RoundedWidget):
 
 
     def winButtonOffset(self) -> int:
+        self.__construct()
         return self.__frame.win_button_offset
     
 
 
     def resizeEnabled(self) -> bool:
+        self.__construct()
         return self.__frame.enable_resize
     
 
@@ -2009,9 +4486,557 @@ class RoundedWindow(RoundedWidget):
     def setWindowStyle(self, window_style: int) -> None:
         if not isinstance(window_style, int):
             raise TypeError("Parameter passed error!")
+        if self.__deferred(self.setWindowStyle, window_style):
+            return
         self.__frame.setWindowStyle(window_style)
 
     
 
     def removeGradients(self) -> None:
-        self.__frame.removeGradients()
\ No newline at end of file
+        if self.__deferred(self.removeGradients):
+            return
+        self.__frame.removeGradients()
+
+
+
+
+
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+
+
+
+
+
+### -----离屏渲染----- ###
+def renderImages(
+    source: RoundedWidget | RoundedStyle | ShadowFrame, 
+    sizes: typing.Iterable[QtCore.QSize | tuple[int, int]], 
+    text: str | None = None, 
+    png: bool = False, 
+    ratio: float = 1.0
+) -> typing.Iterator[QtGui.QImage | bytes]:
+
+    shadow_frame = None
+    font = None
+
+    if isinstance(source, ShadowFrame):
+        shadow_frame = source
+        source = source.bindObject()
+        if source is None:
+            raise AttributeError("The 'bind_obj' of the frame is None")
+    if isinstance(source, RoundedButton):
+        text = source.text() if text is None else text
+        font = source.font()
+    if isinstance(source, RoundedWidget):
+        style = source.roundedStyle()
+    elif isinstance(source, RoundedStyle):
+        style = source
+    else:
+        raise TypeError("Parameter passed error! The source must be 'RoundedWidget', 'RoundedStyle' or 'ShadowFrame'.")
+    if not isinstance(ratio, (int, float)) or ratio <= 0:
+        raise TypeError("Parameter passed error! The ratio must be a positive 'int' or 'float'.")
+
+    ### 离屏代理控件（不显示，不进入事件循环） ###
+    container = QtWidgets.QWidget()
+    container.setAttribute(QtCore.Qt.WA_DontShowOnScreen)
+    if text is not None:
+        proxy = RoundedButton(container, text)
+        if font is not None:
+            proxy.setFont(font)
+    else:
+        proxy = RoundedWidget(container)
+    proxy.applyStyle(style)
+
+    margin = 0
+    frame = None
+    if shadow_frame is not None:
+        margin = shadow_frame.shadowWidth()
+        frame = ShadowFrame(container, proxy)
+        with frame.batchUpdate():
+            frame.setNinePatchEnabled(shadow_frame.ninePatchEnabled())
+            frame.setShadowWidth(margin)
+            for pos, color in shadow_frame.colorStops():
+                frame.setColorAt(pos, color)
+            if shadow_frame.blurShadow() is not None:
+                frame.setBlurShadow(*shadow_frame.blurShadow())
+
+    image = None
+    for size in sizes:
+        if isinstance(size, tuple):
+            size = QtCore.QSize(*size)
+        elif not isinstance(size, QtCore.QSize):
+            raise TypeError("Parameter passed error! The size type must be 'QSize' or 'tuple'.")
+
+        proxy.setGeometry(margin, margin, size.width(), size.height())
+        container.resize(size.width() + 2 * margin, size.height() + 2 * margin)
+        if frame is not None:
+            frame.setShadowWidth(margin)
+        if proxy.layout() is not None:
+            proxy.layout().activate()
+
+        target = container.size() * ratio
+        if image is None or image.size() != target:
+            image = QtGui.QImage(target, QtGui.QImage.Format_ARGB32_Premultiplied)
+            image.setDevicePixelRatio(ratio)
+        image.fill(QtCore.Qt.transparent)
+
+        painter = QtGui.QPainter(image)
+        container.render(painter, QtCore.QPoint(), QtGui.QRegion(), QtWidgets.QWidget.DrawChildren)
+        painter.end()
+
+        if png:
+            data = QtCore.QByteArray()
+            buffer = QtCore.QBuffer(data)
+            buffer.open(QtCore.QIODevice.WriteOnly)
+            image.save(buffer, "PNG")
+            buffer.close()
+            yield bytes(data)
+        else:
+            yield image.copy()
+
+
+
+
+
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+
+
+
+
+
+### -----并行光栅化----- ###
+_raster_pool: concurrent.futures.ThreadPoolExecutor = None
+
+
+
+def _rasterPool() -> concurrent.futures.ThreadPoolExecutor:
+    global _raster_pool
+    if _raster_pool is None:
+        _raster_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 1),
+            thread_name_prefix="MyWidgets-raster"
+        )
+    return _raster_pool
+
+
+
+def rasterizeParallel(tasks: typing.Iterable[typing.Callable[[], QtGui.QImage]]) -> list[QtGui.QImage]:
+    ### 工作线程只接触QImage/QPainter，QPixmap只能在GUI线程中创建 ###
+    futures = [_rasterPool().submit(task) for task in tasks]
+    return [future.result() for future in futures]
+
+
+
+def prewarmRenderCache(
+    objects: typing.Iterable[RoundedWidget | ShadowFrame], 
+    ratio: float | None = None
+) -> int:
+    tasks: dict[tuple, typing.Callable[[], QtGui.QImage]] = {}
+
+    for obj in objects:
+        if isinstance(obj, RoundedWidget):
+            if not obj.cacheShared():
+                continue
+            obj_ratio = obj.devicePixelRatioF() if ratio is None else ratio
+            margin = obj.shadowMargin()
+            key = obj.cacheKey(obj_ratio)
+            if key not in tasks and not _shared_render_cache.contains(key):
+                ### 基类roundedStyle()描述的是当前绘制的外观 ###
+                tasks[key] = functools.partial(
+                    rasterizeRoundedShape, 
+                    RoundedWidget.roundedStyle(obj), 
+                    (obj.width() - 2 * margin, obj.height() - 2 * margin), 
+                    obj_ratio
+                )
+            if margin > 0:
+                stops = obj.shadowColorStops()
+                key = _shadowTextureKey(obj.radius(), margin, obj_ratio, stops)
+                if key not in tasks and not _shared_render_cache.contains(key):
+                    tasks[key] = functools.partial(rasterizeShadow, obj.radius(), margin, stops, None, obj_ratio)
+
+        elif isinstance(obj, ShadowFrame):
+            bind_obj = obj.bindObject()
+            if bind_obj is None or not obj.ninePatchEnabled():
+                continue
+            obj_ratio = bind_obj.devicePixelRatioF() if ratio is None else ratio
+            stops = obj.colorStops()
+            key = _shadowTextureKey(bind_obj.radius(), obj.shadowWidth(), obj_ratio, stops)
+            if key not in tasks and not _shared_render_cache.contains(key):
+                tasks[key] = functools.partial(
+                    rasterizeShadow, bind_obj.radius(), obj.shadowWidth(), stops, None, obj_ratio
+                )
+
+        else:
+            raise TypeError("Parameter passed error! The parameter type must be 'RoundedWidget' or 'ShadowFrame'.")
+
+    images = rasterizeParallel(tasks.values())
+    for key, image in zip(tasks, images):
+        _shared_render_cache.insert(key, QtGui.QPixmap.fromImage(image))
+    return len(tasks)
+
+
+
+
+
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+
+
+
+
+
+### -----圆角列表项代理----- ###
+class RoundedItemDelegate(QtWidgets.QStyledItemDelegate):
+
+    ### 函数重载 ###
+    @typing.overload
+    def __init__(self, view: QtWidgets.QAbstractItemView) -> None: pass
+    @typing.overload
+    def __init__(self, view: QtWidgets.QAbstractItemView, style: RoundedStyle | None = ...) -> None: pass
+
+
+
+    ### 构造函数 ###
+    def __init__(self, view: QtWidgets.QAbstractItemView, style: RoundedStyle | None = None) -> None:
+        if not isinstance(view, QtWidgets.QAbstractItemView):
+            raise TypeError("Parameter passed error! The parameter type must be 'QAbstractItemView'.")
+        elif style is not None and not isinstance(style, RoundedStyle):
+            raise TypeError("Parameter passed error! The parameter type must be 'RoundedStyle'.")
+        super().__init__(view)
+
+        ### private属性 ###
+        self.__view:            QtWidgets.QAbstractItemView = view
+        self.__style:           RoundedStyle = _ITEM_LIGHT_STYLE if style is None else style
+        self.__hover_index:     QtCore.QPersistentModelIndex = QtCore.QPersistentModelIndex()
+        self.__pressed_index:   QtCore.QPersistentModelIndex = QtCore.QPersistentModelIndex()
+        self.__item_margin:     int = 4
+        self.__item_size:       QtCore.QSize = None
+        self.__text_font:       QtGui.QFont = QtGui.QFont()
+        self.__alignment:       QtCore.Qt.Alignment = QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft
+
+        ### 初始化 ###
+        self.__text_font.setFamily("微软雅黑")
+        self.__text_font.setPointSize(11)
+        self.__view.viewport().setMouseTracking(True)          ### 悬停与按下按索引记录，而不是按控件 ###
+        self.__view.viewport().installEventFilter(self)
+
+
+
+    ### private类函数 ###
+    def __updateIndexes(self, old: QtCore.QPersistentModelIndex, new: QtCore.QModelIndex) -> None:
+        for changed in (old, new):
+            if changed.isValid():
+                self.__view.viewport().update(self.__view.visualRect(QtCore.QModelIndex(changed)))
+
+
+
+    def __setHoverIndex(self, index: QtCore.QModelIndex) -> None:
+        if self.__hover_index == index:
+            return
+        old = self.__hover_index
+        self.__hover_index = QtCore.QPersistentModelIndex(index)
+        self.__updateIndexes(old, index)
+
+
+
+    def __setPressedIndex(self, index: QtCore.QModelIndex) -> None:
+        if self.__pressed_index == index:
+            return
+        old = self.__pressed_index
+        self.__pressed_index = QtCore.QPersistentModelIndex(index)
+        self.__updateIndexes(old, index)
+
+
+
+    def __stateOf(self, index: QtCore.QModelIndex) -> str:
+        if self.__pressed_index.isValid() and self.__pressed_index == index:
+            return "pressed" if self.__hover_index == index else "standard"       ### 与RoundedButton.leaveEvent一致 ###
+        elif self.__hover_index.isValid() and self.__hover_index == index and not self.__pressed_index.isValid():
+            return "entered"
+        return "standard"
+
+
+
+    def __pixmap(self, style: RoundedStyle, state: str, width: int, height: int, ratio: float) -> QtGui.QPixmap:
+        ### 每个 (状态, 尺寸, 样式) 只渲染一次，结果放入共享渲染缓存 ###
+        key = ("RoundedItem", state, width, height, ratio, style.key())
+        pixmap = _shared_render_cache.find(key)
+        if pixmap is None:
+            pixmap = QtGui.QPixmap.fromImage(rasterizeRoundedShape(style, (width, height), ratio, state))
+            _shared_render_cache.insert(key, pixmap)
+        return pixmap
+
+
+
+    ### 重写类函数 ###
+    def eventFilter(self, a0: QtCore.QObject, a1: QtCore.QEvent) -> bool:
+        match a1.type():
+            case QtCore.QEvent.MouseMove:
+                self.__setHoverIndex(self.__view.indexAt(a1.pos()))
+            case QtCore.QEvent.Leave:
+                self.__setHoverIndex(QtCore.QModelIndex())
+            case QtCore.QEvent.MouseButtonPress:
+                if a1.button() == QtCore.Qt.MouseButton.LeftButton:
+                    self.__setPressedIndex(self.__view.indexAt(a1.pos()))
+            case QtCore.QEvent.MouseButtonRelease:
+                if a1.button() == QtCore.Qt.MouseButton.LeftButton:
+                    self.__setPressedIndex(QtCore.QModelIndex())
+        return False            ### 只观察视口事件，不走QStyledItemDelegate针对编辑器的过滤 ###
+
+
+
+    def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> None:
+        rect = option.rect.adjusted(
+            self.__item_margin, self.__item_margin, -self.__item_margin, -self.__item_margin
+        )
+        if rect.width() <= 0 or rect.height() <= 0:
+            return
+
+        style = self.itemStyle(index)
+        ratio = painter.device().devicePixelRatioF()
+        painter.drawPixmap(rect.topLeft(), self.__pixmap(style, self.__stateOf(index), rect.width(), rect.height(), ratio))
+
+        text = index.data(QtCore.Qt.DisplayRole)
+        if text is None or text == "":
+            return
+        padding = self.__item_margin + (10 if style.radius() is None else style.radius()) / 2
+        static_text = _text_layout_cache.staticText(
+            str(text), self.__text_font, rect.width() - 2 * padding, QtCore.Qt.ElideRight
+        )
+        size = static_text.size()
+        if self.__alignment & QtCore.Qt.AlignHCenter:
+            x = rect.x() + (rect.width() - size.width()) / 2
+        elif self.__alignment & QtCore.Qt.AlignRight:
+            x = rect.right() + 1 - padding - size.width()
+        else:
+            x = rect.x() + padding
+        color = style.textColor()
+        painter.save()
+        painter.setFont(self.__text_font)
+        painter.setPen(QtGui.QColor(50, 50, 50) if color is None else color)
+        painter.drawStaticText(QtCore.QPointF(x, rect.y() + (rect.height() - size.height()) / 2), static_text)
+        painter.restore()
+
+
+
+    def sizeHint(self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> QtCore.QSize:
+        if self.__item_size is not None:
+            return QtCore.QSize(self.__item_size)
+        metrics = QtGui.QFontMetrics(self.__text_font)
+        return QtCore.QSize(
+            metrics.horizontalAdvance(str(index.data(QtCore.Qt.DisplayRole) or "")) + 4 * self.__item_margin + 20,
+            metrics.height() + 2 * self.__item_margin + 20
+        )
+
+
+
+    ### 定义类函数 ###
+    def itemStyle(self, index: QtCore.QModelIndex) -> RoundedStyle:
+        return self.__style
+
+
+
+    def setDefaultItemStyle(self, style: RoundedStyle) -> None:
+        if not isinstance(style, RoundedStyle):
+            raise TypeError("Parameter passed error! The parameter type must be 'RoundedStyle'.")
+        self.__style = style
+        self.__view.viewport().update()
+
+
+
+    def defaultItemStyle(self) -> RoundedStyle:
+        return self.__style
+
+
+
+    def setItemMargin(self, margin: int) -> None:
+        if not isinstance(margin, int):
+            raise TypeError("Parameter passed error! The parameter type must be 'int'.")
+        self.__item_margin = max(0, margin)
+        self.sizeHintChanged.emit(QtCore.QModelIndex())
+        self.__view.viewport().update()
+
+
+
+    def itemMargin(self) -> int:
+        return self.__item_margin
+
+
+
+    def setItemSize(self, size: QtCore.QSize | None) -> None:
+        if size is not None and not isinstance(size, QtCore.QSize):
+            raise TypeError("Parameter passed error! The parameter type must be 'QSize'.")
+        self.__item_size = None if size is None else QtCore.QSize(size)
+        self.sizeHintChanged.emit(QtCore.QModelIndex())
+
+
+
+    def itemSize(self) -> QtCore.QSize | None:
+        return None if self.__item_size is None else QtCore.QSize(self.__item_size)
+
+
+
+    def setFont(self, font: QtGui.QFont) -> None:
+        if not isinstance(font, QtGui.QFont):
+            raise TypeError("Parameter passed error! The parameter type must be 'QFont'.")
+        self.__text_font = QtGui.QFont(font)
+        self.__view.viewport().update()
+
+
+
+    def font(self) -> QtGui.QFont:
+        return QtGui.QFont(self.__text_font)
+
+
+
+    def setTextAlignment(self, alignment: QtCore.Qt.Alignment) -> None:
+        self.__alignment = alignment
+        self.__view.viewport().update()
+
+
+
+    def hoverIndex(self) -> QtCore.QModelIndex:
+        return QtCore.QModelIndex(self.__hover_index)
+
+
+
+    def pressedIndex(self) -> QtCore.QModelIndex:
+        return QtCore.QModelIndex(self.__pressed_index)
+
+
+
+
+
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+
+
+
+
+
+### -----圆角按钮代理----- ###
+class RoundedButtonDelegate(RoundedItemDelegate):
+
+    ### 定义信号 ###
+    clicked:    QtCore.pyqtSignal = QtCore.pyqtSignal(QtCore.QModelIndex)
+
+    ### 模型中存放RoundedStyle的角色 ###
+    StyleRole: int = QtCore.Qt.UserRole + 32
+
+
+
+    ### 函数重载 ###
+    @typing.overload
+    def __init__(self, view: QtWidgets.QAbstractItemView) -> None: pass
+    @typing.overload
+    def __init__(self, view: QtWidgets.QAbstractItemView, style: RoundedStyle | None = ...) -> None: pass
+
+
+
+    ### 构造函数 ###
+    def __init__(self, view: QtWidgets.QAbstractItemView, style: RoundedStyle | None = None) -> None:
+        super().__init__(view, style)
+
+        ### private属性 ###
+        self.__view:    QtWidgets.QAbstractItemView = view
+
+        ### 初始化 ###
+        self.setTextAlignment(QtCore.Qt.AlignCenter)
+
+
+
+    ### 重写类函数 ###
+    def eventFilter(self, a0: QtCore.QObject, a1: QtCore.QEvent) -> bool:
+        if a1.type() == QtCore.QEvent.MouseButtonRelease and a1.button() == QtCore.Qt.MouseButton.LeftButton:
+            pressed = self.pressedIndex()
+            released = self.__view.indexAt(a1.pos())
+            result = super().eventFilter(a0, a1)
+            if pressed.isValid() and pressed == released:
+                self.clicked.emit(pressed)
+            return result
+        return super().eventFilter(a0, a1)
+
+
+
+    ### 定义类函数 ###
+    def itemStyle(self, index: QtCore.QModelIndex) -> RoundedStyle:
+        ### 模型数据中的样式优先，未设置的键仍按按钮的状态回退规则处理 ###
+        style = index.data(self.StyleRole)
+        if isinstance(style, RoundedStyle):
+            return style
+        return super().itemStyle(index)
+
+
+
+
+
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+### ============================================================================================================= ###
+
+
+
+
+
+### -----圆角列表----- ###
+class RoundedListView(QtWidgets.QListView):
+
+    ### 函数重载 ###
+    @typing.overload
+    def __init__(self) -> None: pass
+    @typing.overload
+    def __init__(self, parent: QtWidgets.QWidget | None = ...) -> None: pass
+
+
+
+    ### 构造函数 ###
+    def __init__(self, a0: QtWidgets.QWidget | None = None) -> None:
+        if a0 is not None and not isinstance(a0, QtWidgets.QWidget):
+            raise TypeError("Parameter passed error!")
+        super().__init__(a0)
+
+        ### private属性 ###
+        self.__delegate:    RoundedItemDelegate = RoundedItemDelegate(self)
+
+        ### 初始化 ###
+        self.setItemDelegate(self.__delegate)
+        self.setUniformItemSizes(True)          ### 只测量一次尺寸，滚动时只绘制可见项 ###
+        self.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.viewport().setAutoFillBackground(False)
+
+
+
+    ### 定义类函数 ###
+    def delegate(self) -> RoundedItemDelegate:
+        return self.__delegate
+
+
+
+    def setItemStyle(self, style: RoundedStyle) -> None:
+        self.__delegate.setDefaultItemStyle(style)
+
+
+
+    def setGridMode(self, judge: bool) -> None:
+        if not isinstance(judge, bool):
+            raise TypeError("Parameter passed error! The parameter type must be 'bool'.")
+        if judge:
+            self.setViewMode(QtWidgets.QListView.IconMode)
+            self.setFlow(QtWidgets.QListView.LeftToRight)
+            self.setResizeMode(QtWidgets.QListView.Adjust)
+            self.setMovement(QtWidgets.QListView.Static)
+            self.setWrapping(True)
+        else:
+            self.setViewMode(QtWidgets.QListView.ListMode)
+            self.setFlow(QtWidgets.QListView.TopToBottom)
+            self.setWrapping(False)
+
@@ -0,0 +1,271 @@
+import argparse
+import gc
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtWidgets, QtCore, QtGui
+from MyLib import MyWidgets
+
+
+
+SIZES:          list = [(60, 30), (200, 120), (800, 600)]
+RADII:          list = [0, 10, 25]
+SHADOW_WIDTHS:  list = [5, 15, 30]
+
+
+
+### measure helpers ###
+def makeGradient(w: int, h: int) -> QtGui.QLinearGradient:
+    grad = QtGui.QLinearGradient()
+    grad.setStart(0, h)
+    grad.setFinalStop(w, 0)
+    grad.setColorAt(0, QtGui.QColor(30, 20, 40))
+    grad.setColorAt(1, QtGui.QColor(125, 125, 200, 180))
+    return grad
+
+
+
+def paintsPerSecond(widget: QtWidgets.QWidget, duration: float) -> dict:
+    image = QtGui.QImage(widget.size(), QtGui.QImage.Format_ARGB32_Premultiplied)
+    widget.render(image)        ### warm up (and fill caches) ###
+
+    count = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < duration:
+        image.fill(QtCore.Qt.transparent)
+        widget.render(image)
+        count += 1
+        elapsed = time.perf_counter() - start
+    return {"paints": count, "seconds": elapsed, "paints_per_second": count / elapsed}
+
+
+
+def residentBytes() -> int | None:
+    try:
+        with open("/proc/self/statm", "r", encoding="utf-8") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None         ### not Linux: memory columns are left empty ###
+
+
+
+def sendMouse(widget: QtWidgets.QWidget, event_type: QtCore.QEvent.Type, global_pos: QtCore.QPoint) -> None:
+    local = QtCore.QPointF(widget.mapFromGlobal(global_pos))
+    buttons = QtCore.Qt.NoButton if event_type == QtCore.QEvent.MouseButtonRelease else QtCore.Qt.LeftButton
+    event = QtGui.QMouseEvent(
+        event_type, local, local, QtCore.QPointF(global_pos),
+        QtCore.Qt.LeftButton, buttons, QtCore.Qt.NoModifier
+    )
+    QtWidgets.QApplication.sendEvent(widget, event)
+
+
+
+### benchmarks ###
+def benchRoundedWidgets(duration: float) -> list:
+    results = []
+    for cls, (w, h), radius, gradient, mode in itertools.product(
+        (MyWidgets.RoundedWidget, MyWidgets.RoundedButton),
+        SIZES, RADII, (False, True), ("direct", "cached", "shared")
+    ):
+        widget = cls()
+        widget.resize(w, h)
+        widget.setRadius(radius)
+        if gradient:
+            widget.setBackgroundGradient(makeGradient(w, h))
+        if mode == "cached":
+            widget.setCacheEnabled(True)
+        elif mode == "shared":
+            widget.setCacheShared(True)
+
+        result = paintsPerSecond(widget, duration)
+        result.update({
+            "class": cls.__name__, "size": [w, h], "radius": radius,
+            "gradient": gradient, "mode": mode
+        })
+        results.append(result)
+        widget.deleteLater()
+    return results
+
+
+
+def benchShadowFrames(duration: float) -> list:
+    results = []
+    for (w, h), radius, shadow_width, nine_patch in itertools.product(
+        SIZES, RADII, SHADOW_WIDTHS, (False, True)
+    ):
+        parent = QtWidgets.QWidget()
+        parent.resize(w + 2 * shadow_width, h + 2 * shadow_width)
+        bind_obj = MyWidgets.RoundedWidget(parent)
+        bind_obj.setRadius(radius)
+        bind_obj.setGeometry(shadow_width, shadow_width, w, h)
+        frame = MyWidgets.ShadowFrame(parent, bind_obj)
+        frame.setNinePatchEnabled(nine_patch)
+        frame.setShadowWidth(shadow_width)
+        frame.setColorAt(0, QtGui.QColor(0, 0, 0, 120))
+        frame.setColorAt(1, QtGui.QColor(0, 0, 0, 0))
+
+        result = paintsPerSecond(parent, duration)
+        result.update({
+            "class": "ShadowFrame", "size": [w, h], "radius": radius,
+            "shadow_width": shadow_width, "nine_patch": nine_patch
+        })
+        results.append(result)
+        parent.deleteLater()
+    return results
+
+
+
+def benchWindowResize(steps: int) -> list:
+    results = []
+    for frame_rate in (0, 60, 120):
+        window = MyWidgets.RoundedWindow()
+        window.setResizeFrameRate(frame_rate)
+        window.show()
+        frame = window.parent()
+        frame.move(100, 100)
+
+        counter = [0]
+        frame.resized.connect(lambda: counter.__setitem__(0, counter[0] + 1))
+        start_pos = frame.mapToGlobal(QtCore.QPoint(frame.width() - 2, frame.height() // 2))
+
+        start = time.perf_counter()
+        sendMouse(frame, QtCore.QEvent.MouseButtonPress, start_pos)
+        for i in range(1, steps + 1):
+            sendMouse(frame, QtCore.QEvent.MouseMove, start_pos + QtCore.QPoint(i % 300, 0))
+        sendMouse(frame, QtCore.QEvent.MouseButtonRelease, start_pos + QtCore.QPoint(steps % 300, 0))
+        elapsed = time.perf_counter() - start
+
+        results.append({
+            "class": "RoundedWindow", "frame_rate": frame_rate, "moves": steps,
+            "seconds": elapsed, "moves_per_second": steps / elapsed,
+            "resizes_applied": counter[0], "final_size": [frame.width(), frame.height()]
+        })
+        window.close()
+        frame.deleteLater()
+    return results
+
+
+
+def benchButtonConstruction(count: int) -> list:
+    results = []
+    for direct_text in (False, True):
+        parent = QtWidgets.QWidget()
+        gc.collect()
+        before = residentBytes()
+
+        start = time.perf_counter()
+        buttons = [MyWidgets.RoundedButton(parent, "OK", direct_text=direct_text) for i in range(count)]
+        elapsed = time.perf_counter() - start
+
+        after = residentBytes()
+        result = {
+            "class": "RoundedButton", "direct_text": direct_text, "buttons": count,
+            "seconds": elapsed, "microseconds_per_button": elapsed / count * 1e6,
+            "bytes_per_button": None if before is None else (after - before) / count
+        }
+        results.append(result)
+
+        del buttons
+        parent.deleteLater()
+        QtWidgets.QApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    return results
+
+
+
+def benchWindowConstruction(count: int) -> list:
+    results = []
+    for lazy in (False, True):
+        start = time.perf_counter()
+        windows = [MyWidgets.RoundedWindow(lazy=lazy) for i in range(count)]
+        elapsed = time.perf_counter() - start
+
+        results.append({
+            "class": "RoundedWindow", "lazy": lazy, "windows": count,
+            "seconds": elapsed, "microseconds_per_window": elapsed / count * 1e6
+        })
+
+        for window in windows:
+            if window.isConstructed():
+                window.parent().deleteLater()
+            else:
+                window.deleteLater()
+        del windows
+        QtWidgets.QApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    return results
+
+
+
+def benchStyleChange(count: int) -> list:
+    results = []
+    for cls in (MyWidgets.RoundedWidget, MyWidgets.RoundedButton):
+        parent = QtWidgets.QWidget()
+        widgets = [cls(parent) for i in range(count)]
+
+        start = time.perf_counter()
+        for widget in widgets:
+            widget.setDarkStyle()
+        for widget in widgets:
+            widget.setLightStyle()
+        elapsed = time.perf_counter() - start
+
+        results.append({
+            "class": cls.__name__, "widgets": count, "calls": 2 * count,
+            "seconds": elapsed, "calls_per_second": 2 * count / elapsed
+        })
+
+        dark = MyWidgets.RoundedStyle(background=QtGui.QColor(20, 20, 45), bottom=QtGui.QColor(200, 200, 200))
+        light = MyWidgets.RoundedStyle(background=QtGui.QColor(240, 240, 240), bottom=QtGui.QColor(50, 50, 50))
+        start = time.perf_counter()
+        MyWidgets.applyStyleTree(parent, dark)
+        MyWidgets.applyStyleTree(parent, light)
+        elapsed = time.perf_counter() - start
+
+        results.append({
+            "class": cls.__name__, "widgets": count, "calls": 2, "method": "applyStyleTree",
+            "seconds": elapsed, "widgets_per_second": 2 * count / elapsed
+        })
+        parent.deleteLater()
+    return results
+
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless benchmarks for MyLib.MyWidgets.")
+    parser.add_argument("--duration", type=float, default=0.1, help="seconds spent on each paint case")
+    parser.add_argument("--resize-steps", type=int, default=2000, help="mouse moves per drag-resize sequence")
+    parser.add_argument("--style-widgets", type=int, default=500, help="widgets restyled per style case")
+    parser.add_argument("--buttons", type=int, default=2000, help="buttons built per construction case")
+    parser.add_argument("--windows", type=int, default=50, help="windows built per construction case")
+    parser.add_argument("--output", type=str, default=None, help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv)
+
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "qt": QtCore.QT_VERSION_STR,
+            "pyqt": QtCore.PYQT_VERSION_STR,
+            "platform": QtGui.QGuiApplication.platformName(),
+            "machine": platform.machine()
+        },
+        "paint": benchRoundedWidgets(args.duration) + benchShadowFrames(args.duration),
+        "resize": benchWindowResize(args.resize_steps),
+        "style": benchStyleChange(args.style_widgets),
+        "construction": benchButtonConstruction(args.buttons) + benchWindowConstruction(args.windows),
+        "render_cache": MyWidgets.sharedRenderCache().statistics()
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)